@@ -3,7 +3,6 @@
 Rich Logger - A beautiful and feature-rich logging package using Rich library.
 """
 import os
-from pathlib import Path
 import traceback
 
 def get_version():
@@ -14,8 +13,8 @@ def get_version():
     version = "0.33"
     """
     try:
-        version_file = Path(__file__).parent / "__version__.py"
-        if version_file.is_file():
+        version_file = os.path.join(os.path.dirname(__file__), "__version__.py")
+        if os.path.isfile(version_file):
             with open(version_file, "r") as f:
                 for line in f:
                     if line.strip().startswith("version"):
@@ -67,6 +66,7 @@ from .logger import (
     SyslogHandler,
     DatabaseHandler,
     getLoggerSimple,
+    set_disabled,
     test,
     test_brokers,
     test_lexer,
@@ -109,6 +109,7 @@ __all__ = [
     "SyslogHandler",
     "DatabaseHandler",
     "getLoggerSimple",
+    "set_disabled",
     "test",
     "test_brokers",
     "test_lexer",
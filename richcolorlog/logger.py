@@ -19,15 +19,22 @@ import shutil
 import socket
 import hashlib
 import time
+import io
 import json
+import queue
+import atexit
+from collections import deque
 from typing import Optional, Union, Iterable, List, Dict, Any, Callable
-from types import ModuleType
+from types import ModuleType, MappingProxyType
 from datetime import datetime
 import threading
 from functools import lru_cache, wraps
 
 CURRENT_HANDLERS = []
 
+# Read once at import so emit() and friends only test a module flag.
+_DEBUG = str(os.getenv('RICHCOLORLOG_DEBUG', '0')).lower() in ('1', 'true', 'yes', 'ok')
+
 # import pygments if available
 try:
     from pygments import highlight
@@ -37,6 +44,37 @@ try:
 except ImportError:
     PYGMENTS_AVAILABLE = False
 
+if PYGMENTS_AVAILABLE:
+    # Building a lexer compiles its regexes, so lexers, the formatter and the
+    # highlighted output of repeated messages are all reused.
+    _TERMINAL_FORMATTER = TerminalFormatter()
+
+    @lru_cache(maxsize=32)
+    def _get_lexer(name):
+        return get_lexer_by_name(name)
+
+    # Per-thread output buffer, reused instead of the StringIO highlight() makes.
+    _HIGHLIGHT_LOCAL = threading.local()
+
+    # Only short messages are cached, so large payloads are not kept alive.
+    _HIGHLIGHT_CACHE_MAX_LEN = 4096
+
+    def _highlight_ansi_uncached(text, lexer_name):
+        buf = getattr(_HIGHLIGHT_LOCAL, 'buf', None)
+        if buf is None:
+            buf = _HIGHLIGHT_LOCAL.buf = io.StringIO()
+        buf.seek(0)
+        buf.truncate()
+        _TERMINAL_FORMATTER.format(_get_lexer(lexer_name).get_tokens(text), buf)
+        return buf.getvalue().rstrip()
+
+    _highlight_ansi_cached = lru_cache(maxsize=1024)(_highlight_ansi_uncached)
+
+    def _highlight_ansi(text, lexer_name):
+        if len(text) <= _HIGHLIGHT_CACHE_MAX_LEN:
+            return _highlight_ansi_cached(text, lexer_name)
+        return _highlight_ansi_uncached(text, lexer_name)
+
 # import rich logging components if available
 try:
     from rich.logging import FormatTimeCallable
@@ -52,7 +90,10 @@ try:
     from rich.table import Table
     from rich.console import Console
     from rich.syntax import Syntax
+    from rich.style import Style
+    from rich.cells import cell_len, set_cell_size
     from rich import traceback as rich_traceback
+    from rich.traceback import Traceback
     from rich.markup import escape as rich_escape
     console = Console()
     RICH_AVAILABLE = True
@@ -539,12 +580,22 @@ def performance_monitor(func):
     
 def _add_custom_level_method(level_name: str, level_value: int):
     def log_method(self, message, *args, **kwargs):
-        extra = kwargs.pop("extra", {})
+        # isEnabledFor() is answered from the logger's level cache, so a
+        # disabled level costs one dict lookup and no record is built.
+        if not self.isEnabledFor(level_value):
+            return
         if "lexer" in kwargs:
-            extra["lexer"] = kwargs.pop("lexer")
-        if self.isEnabledFor(level_value):
-            self._log(level_value, message, args, extra=extra, stacklevel=3, **kwargs)
-    setattr(logging.Logger, level_name.lower(), log_method)
+            kwargs["extra"] = dict(kwargs.get("extra") or {}, lexer=kwargs.pop("lexer"))
+        self._log(level_value, message, args, stacklevel=3, **kwargs)
+
+    method_name = level_name.lower()
+    log_method.__name__ = method_name
+    log_method.__doc__ = (
+        f"Log 'message % args' with severity '{level_name}'.\n\n"
+        f"Pass arguments separately (logger.{method_name}(\"x=%s\", x)) instead of an\n"
+        f"f-string so formatting only happens when the level is enabled."
+    )
+    setattr(logging.Logger, method_name, log_method)
 
 # Add custom logging methods
 _add_custom_level_method("EMERGENCY", EMERGENCY_LEVEL)
@@ -557,6 +608,16 @@ _add_custom_level_method("DANGER", DANGER_LEVEL)
 
 # ==================== Icon Support ====================
 
+_terminal_width_cache = {'width': 0, 'checked': 0.0}
+
+def _terminal_width():
+    """Terminal width, re-read at most once per second."""
+    now = time.monotonic()
+    if now - _terminal_width_cache['checked'] >= 1.0:
+        _terminal_width_cache['width'] = shutil.get_terminal_size()[0]
+        _terminal_width_cache['checked'] = now
+    return _terminal_width_cache['width']
+
 def print_traceback(exc_info, padding_left = 0, show_datetime = True, show_emoji = False, emoji = "❌ ", console = None):
     try:
         from rich.text import Text
@@ -573,7 +634,7 @@ def print_traceback(exc_info, padding_left = 0, show_datetime = True, show_emoji
         
     if padding_left == None:
         padding_left = 0
-    terminal_width = shutil.get_terminal_size()[0]
+    terminal_width = _terminal_width()
     icon = emoji + ' ' if show_emoji else ' '
     timestamp = ''
     
@@ -595,11 +656,11 @@ def print_traceback(exc_info, padding_left = 0, show_datetime = True, show_emoji
     tb_text = Text("\n".join([padding_left *' ' if padding_left else 4 *' ' +  i for i in tb_string.split("\n")]), style="#00FFFF")
     
     
-    console.print(Text(icon) + Text(padding_left *' ') + type_text if not show_datetime else type_text, end='')
+    console.print(Text.assemble(icon, padding_left * ' ', type_text) if not show_datetime else type_text, end='')
     console.print(" : ", end='')
     #if not padding_left: padding_left = 4
     console.print(value_text)
-    console.print(Text(padding_left *' ') + tb_text)
+    console.print(Text.assemble(padding_left * ' ', tb_text))
     if not padding_left:
         padding_left = 4
         console.print(f"[bold]{timestamp}[/bold] - ", end='') if timestamp else None
@@ -735,36 +796,80 @@ class IconFilter(logging.Filter):
         NOTICE_LEVEL: Icon.notice,
         FATAL_LEVEL: Icon.fatal,
     }
-    
-    def __init__(self, icon_first=False):
+
+    # (icon, first code point) per level, for the cheap "already tagged" check
+    ICON_PREFIX_MAP = {level: (icon, icon[0]) for level, icon in LEVEL_ICON_MAP.items()}
+
+    def __init__(self, icon_first=False, prefix_message=False):
         """
         Initialize IconFilter.
-        
+
         Args:
             icon_first (bool): Only used by handler to determine position.
                              This filter always sets record.icon.
+            prefix_message (bool): Also prepend the icon to record.msg, for
+                             plain handlers that don't render record.icon.
         """
         super().__init__()
         self.icon_first = icon_first  # Can be ignored here, handlers that set positions
-    
+        self.prefix_message = prefix_message
+
+    def __eq__(self, other):
+        # Equal filters make Handler.addFilter() skip duplicates, so the
+        # icon is never computed (or prefixed) twice for one handler.
+        if not isinstance(other, IconFilter):
+            return NotImplemented
+        return self.prefix_message == other.prefix_message
+
+    def __hash__(self):
+        return hash((IconFilter, self.prefix_message))
+
     def filter(self, record):
         """Always set record.icon based on level."""
-        record.icon = self.LEVEL_ICON_MAP.get(record.levelno, "")
+        icon, first_cp = self.ICON_PREFIX_MAP.get(record.levelno, ("", ""))
+        record.icon = icon
+        if self.prefix_message and icon:
+            msg = record.msg
+            if not (isinstance(msg, str) and msg and msg[0] == first_cp and msg.startswith(icon)):
+                record.msg = f"{icon} {msg}"
         return True
 
+_ENV_TRUE = frozenset({'1', 'true', 'yes'})
+_ENV_FALSE = frozenset({'0', 'false', 'no'})
+
+# Runtime switch set by set_disabled(); checked alongside the environment.
+_RUNTIME_DISABLED = False
+
 def _is_logging_disabled():
-    """Check environment variables to see if logging should be disabled."""
-    NO_LOGGING = str(os.getenv('NO_LOGGING', '0')).lower() in ['1', 'true', 'yes']
-    LOGGING_DISABLED = str(os.getenv('LOGGING', '1')).lower() in ['0', 'false', 'no']
+    """Check the runtime switch and environment variables to see if logging should be disabled."""
+    return _RUNTIME_DISABLED or _is_env_logging_disabled()
+
+def _is_env_logging_disabled():
+    """Check only the ``NO_LOGGING``/``LOGGING`` environment variables."""
+    environ = os.environ
+    return (
+        environ.get('NO_LOGGING', '0').lower() in _ENV_TRUE
+        or environ.get('LOGGING', '1').lower() in _ENV_FALSE
+    )
+
+def set_disabled(disabled=True):
+    """Switch logging off (or back on) at runtime without touching handlers.
     
-    return NO_LOGGING or LOGGING_DISABLED
+    Sets a module-level flag that :class:`CustomLogger` checks on every call,
+    so the environment (and any subprocess) is left untouched. The
+    ``NO_LOGGING``/``LOGGING`` environment switches still disable logging on
+    their own. Messages logged with ``show=True`` are still emitted while
+    disabled.
+    """
+    global _RUNTIME_DISABLED
+    _RUNTIME_DISABLED = bool(disabled)
 
 def _setup_logging_state(enable):
     """Setup logging state (enable or disable)."""
     global CURRENT_HANDLERS
     
     root_logger = logging.getLogger()
-    debug_mode = str(os.getenv('RICHCOLORLOG_DEBUG', '0')).lower() in ['1', 'true']
+    debug_mode = _DEBUG
     
     if not enable:
         # Save handlers before clearing them
@@ -812,12 +917,14 @@ class CustomLogger(logging.Logger):
             extra["type"] = kwargs.pop("type")
         
         # Debug output
-        debug_mode = str(os.getenv("RICHCOLORLOG_DEBUG", "0")).lower() in ["1", "true", "ok", "yes"]
+        debug_mode = _DEBUG
         if debug_mode:
             print(f"force_show: {force_show}, level: {level}")
         
         # Determine if we should log this message
         should_log = True
+        env_disabled = _is_env_logging_disabled()
+        was_disabled = _RUNTIME_DISABLED or env_disabled
         
         if force_show is False:
             # Explicitly hide this message
@@ -827,7 +934,7 @@ class CustomLogger(logging.Logger):
             should_log = True
         else:
             # Use global settings
-            should_log = not _is_logging_disabled()
+            should_log = not was_disabled
         
         if debug_mode:
             print(f"should_log: {should_log}")
@@ -835,9 +942,11 @@ class CustomLogger(logging.Logger):
         # Log the message if we should
         if should_log:
             # Temporarily enable logging for this message if needed
-            was_disabled = _is_logging_disabled()
-            
-            if was_disabled or force_show is True:
+            if force_show is True and was_disabled and not env_disabled:
+                # Only set_disabled() is in effect and it leaves the root
+                # logger alone, so there is nothing to re-enable.
+                super()._log(level, msg, args, exc_info, extra, stack_info, stacklevel)
+            elif was_disabled or force_show is True:
                 # Need to temporarily enable logging
                 original_no_logging = os.getenv("NO_LOGGING")
                 original_logging = os.getenv("LOGGING")
@@ -853,7 +962,7 @@ class CustomLogger(logging.Logger):
                 super()._log(level, msg, args, exc_info, extra, stack_info, stacklevel)
                 
                 # Restore original state if it was disabled
-                if was_disabled:
+                if env_disabled:
                     if original_no_logging:
                         os.environ["NO_LOGGING"] = str(original_no_logging)
                     if original_logging:
@@ -868,40 +977,46 @@ class CustomLogger(logging.Logger):
                 super()._log(level, msg, args, exc_info, extra, stack_info, stacklevel)
         
         if debug_mode:
-            print("-" * os.get_terminal_size()[0])
+            print("-" * _terminal_width())
 
+    # Like the stock Logger methods, check the level before building a record;
+    # show=... still goes through _log, which decides on its own.
     def debug(self, msg, *args, **kwargs):
-        self._log(logging.DEBUG, msg, args, stacklevel=3, **kwargs)
+        if self.isEnabledFor(logging.DEBUG) or 'show' in kwargs:
+            self._log(logging.DEBUG, msg, args, stacklevel=3, **kwargs)
 
     def info(self, msg, *args, **kwargs):
-        self._log(logging.INFO, msg, args, stacklevel=3, **kwargs)
+        if self.isEnabledFor(logging.INFO) or 'show' in kwargs:
+            self._log(logging.INFO, msg, args, stacklevel=3, **kwargs)
 
     def success(self, msg, *args, **kwargs):
-        # Assuming SUCCESS_LEVEL is defined elsewhere
-        SUCCESS_LEVEL = 25
-        self._log(SUCCESS_LEVEL, msg, args, stacklevel=3, **kwargs)
+        if self.isEnabledFor(SUCCESS_LEVEL) or 'show' in kwargs:
+            self._log(SUCCESS_LEVEL, msg, args, stacklevel=3, **kwargs)
 
     def warning(self, msg, *args, **kwargs):
-        self._log(logging.WARNING, msg, args, stacklevel=3, **kwargs)
+        if self.isEnabledFor(logging.WARNING) or 'show' in kwargs:
+            self._log(logging.WARNING, msg, args, stacklevel=3, **kwargs)
 
     def error(self, msg, *args, **kwargs):
-        self._log(logging.ERROR, msg, args, stacklevel=3, **kwargs)
+        if self.isEnabledFor(logging.ERROR) or 'show' in kwargs:
+            self._log(logging.ERROR, msg, args, stacklevel=3, **kwargs)
 
     def critical(self, msg, *args, **kwargs):
-        self._log(logging.CRITICAL, msg, args, stacklevel=3, **kwargs)
+        if self.isEnabledFor(logging.CRITICAL) or 'show' in kwargs:
+            self._log(logging.CRITICAL, msg, args, stacklevel=3, **kwargs)
 
     def primary(self, msg, *args, **kwargs):
-        # Assuming PRIMARY_LEVEL is defined elsewhere
-        PRIMARY_LEVEL = 35
-        self._log(PRIMARY_LEVEL, msg, args, stacklevel=3, **kwargs)
+        if self.isEnabledFor(PRIMARY_LEVEL) or 'show' in kwargs:
+            self._log(PRIMARY_LEVEL, msg, args, stacklevel=3, **kwargs)
 
     def danger(self, msg, *args, **kwargs):
-        # Assuming DANGER_LEVEL is defined elsewhere
-        DANGER_LEVEL = 45
-        self._log(DANGER_LEVEL, msg, args, stacklevel=3, **kwargs)
+        if self.isEnabledFor(DANGER_LEVEL) or 'show' in kwargs:
+            self._log(DANGER_LEVEL, msg, args, stacklevel=3, **kwargs)
 
     def exception(self, msg, *args, exc_info=True, **kwargs):
         """Log an exception with traceback."""
+        if not (self.isEnabledFor(logging.ERROR) or 'show' in kwargs):
+            return
         if exc_info is True or str(kwargs.get("tb", "")).lower() in ["1", "true", "yes", "ok"]:
             exc_info = sys.exc_info()
         if not str(os.getenv('TRACEBACK', '0')).lower() in ['1', 'true', 'yes', 'ok', 'on']:
@@ -1132,7 +1247,7 @@ class CustomFormatter(logging.Formatter):
 class CustomRichFormatter(logging.Formatter):
     """Enhanced Rich formatter with syntax highlighting support."""
     
-    LEVEL_STYLES = SafeDict({
+    LEVEL_STYLES = MappingProxyType(SafeDict({
         logging.DEBUG: "bold #FFAA00",
         logging.INFO: "bold #00FFFF",
         logging.SUCCESS: "bold #00FFFF",
@@ -1143,7 +1258,19 @@ class CustomRichFormatter(logging.Formatter):
         EMERGENCY_LEVEL: "bright_white on #AA00FF",
         ALERT_LEVEL: "bright_white on #005500",
         NOTICE_LEVEL: "black on #00FFFF",
-    })
+    }))
+
+    # Used instead of LEVEL_STYLES when show_background=False
+    LEVEL_STYLES_NO_BG = MappingProxyType(SafeDict({
+        **LEVEL_STYLES,
+        logging.WARNING: "#FFFF00",
+        logging.ERROR: "red",
+        logging.CRITICAL: "bold #550000",
+        FATAL_LEVEL: "#0055FF",
+        EMERGENCY_LEVEL: "#AA00FF",
+        ALERT_LEVEL: "#005500",
+        NOTICE_LEVEL: "#00FFFF",
+    }))
 
     def __init__(
         self,
@@ -1159,15 +1286,7 @@ class CustomRichFormatter(logging.Formatter):
         self.icon_first = icon_first
         
         if not show_background:
-            self.LEVEL_STYLES.update({
-                logging.WARNING: "#FFFF00",
-                logging.ERROR: "red",
-                logging.CRITICAL: "bold #550000",
-                FATAL_LEVEL: "#0055FF",
-                EMERGENCY_LEVEL: "#AA00FF",
-                ALERT_LEVEL: "#005500",
-                NOTICE_LEVEL: "#00FFFF",
-            })
+            self.LEVEL_STYLES = self.LEVEL_STYLES_NO_BG
 
     @performance_monitor
     def format(self, record: logging.LogRecord) -> str:
@@ -1179,10 +1298,11 @@ class CustomRichFormatter(logging.Formatter):
         
         # Get original message (already processed by IconFilter if icon_first=False)
         raw_message = record.getMessage()
-        safe_message = rich_escape(raw_message)
+        # Only markup needs escaping, and markup always starts with "["
+        safe_message = rich_escape(raw_message) if "[" in raw_message else raw_message
 
         # Get icon only if icon_first=True
-        icon = getattr(record, 'icon', "")
+        icon = record.__dict__.get('icon', "")
 
         if self.icon_first and icon:
             prefix = f"{icon} [{style}]{levelname} - {location}[/]"
@@ -1208,7 +1328,7 @@ class CustomLogFormatter(logging.Formatter):
         raw_message = record.getMessage()
         
         # Get icon only if icon_first=True
-        icon = getattr(record, 'icon', "")
+        icon = record.__dict__.get('icon', "")
 
         if self.icon_first and icon:
             prefix = f"{icon} {levelname} - {location}"
@@ -1296,11 +1416,12 @@ class LevelBasedFileFormatter(CustomLogFormatter):
         self.info_formatter = logging.Formatter(self.info_format)
         self.debug_formatter = logging.Formatter(self.debug_format)
 
+        # Bound methods, so format() skips two attribute lookups per record
+        self._info_fmt = self.info_formatter.format
+        self._debug_fmt = self.debug_formatter.format
+
     def format(self, record):
-        if record.levelno <= logging.DEBUG:
-            return self.debug_formatter.format(record)
-        else:
-            return self.info_formatter.format(record)
+        return self._debug_fmt(record) if record.levelno <= logging.DEBUG else self._info_fmt(record)
 
 # ==================== Message Broker Handlers ====================
 
@@ -1318,12 +1439,18 @@ class RabbitMQHandler(logging.Handler):
         self.vhost = vhost
         self.connection = None
         self.channel = None
+        self._properties = None
         self._connect()
     
     def _connect(self):
         """Establish connection to RabbitMQ."""
         try:
             import pika
+            # Same for every message, so built once here rather than per emit
+            self._properties = pika.BasicProperties(
+                delivery_mode=2,
+                content_type='application/json'
+            )
             credentials = pika.PlainCredentials(self.username, self.password)
             parameters = pika.ConnectionParameters(
                 host=self.host,
@@ -1349,7 +1476,6 @@ class RabbitMQHandler(logging.Handler):
             return
         
         try:
-            import pika
             routing_key = record.levelname.lower()
             
             message = {
@@ -1369,10 +1495,7 @@ class RabbitMQHandler(logging.Handler):
                 exchange=self.exchange,
                 routing_key=routing_key,
                 body=json.dumps(message),
-                properties=pika.BasicProperties(
-                    delivery_mode=2,
-                    content_type='application/json'
-                )
+                properties=self._properties
             )
         except Exception as e:
             logging.error(f"Failed to send log to RabbitMQ: {e}")
@@ -1659,16 +1782,16 @@ class SyslogHandler(logging.handlers.SysLogHandler):
 class ChunkedSyslogReassembler:
     """Helper class to reassemble chunked syslog messages on receiving side."""
     
+    CHUNK_RE = re.compile(r'<\d+>.*?\[([a-f0-9]+):(\d+)/(\d+)\]\s+(.*)')
+    
     def __init__(self, timeout=5.0):
         self.chunks = {}  # msg_id -> {chunks: dict, timestamp: float, total: int}
         self.timeout = timeout
     
     def add_chunk(self, message):
         """Add a chunk and return complete message if all chunks received."""
-        import re
-        
         # Parse chunk header: [MSG_ID:chunk/total]
-        match = re.match(r'<\d+>.*?\[([a-f0-9]+):(\d+)/(\d+)\]\s+(.*)', message)
+        match = self.CHUNK_RE.match(message)
         if not match:
             # Not a chunked message, return as-is
             return message
@@ -1713,8 +1836,12 @@ class ChunkedSyslogReassembler:
 class DatabaseHandler(logging.Handler):
     """Handler to send log to the database."""
     
+    COLUMNS = ('timestamp', 'level', 'logger', 'message', 'module', 'function',
+               'lineno', 'pathname', 'process', 'thread')
+    
     def __init__(self, db_type='postgresql', host='localhost', port=None, 
-                 database='logs', user='postgres', password='', level=logging.DEBUG):
+                 database='logs', user='postgres', password='', level=logging.DEBUG,
+                 use_async=False, queue_size=10000, batch_size=500, sqlite_wal=True):
         super().__init__(level)
         self.db_type = db_type.lower()
         self.host = host
@@ -1723,8 +1850,49 @@ class DatabaseHandler(logging.Handler):
         self.user = user
         self.password = password
         self.connection = None
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.sqlite_wal = sqlite_wal
+        self.dropped_count = 0
+        self._queue = None
+        self._worker = None
+        self._fanout_trigger = False
+
+        placeholders = ", ".join(["?" if self.db_type == 'sqlite' else "%s"] * len(self.COLUMNS))
+        columns = ", ".join(self.COLUMNS)
+        self._insert_sql = {
+            table: f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+            for table in set(LEVEL_TO_TABLE.values()) | {'log_syslog'}
+        }
+        self._syslog_sql = self._insert_sql['log_syslog']
+        self._table_by_level = {
+            logging.getLevelName(levelno): table for levelno, table in LEVEL_TO_TABLE.items()
+        }
+        # Level names that are never evicted from a full queue.
+        self._preserved_levels = {
+            logging.getLevelName(levelno) for levelno in LEVEL_TO_TABLE if levelno >= logging.ERROR
+        } | {logging.getLevelName(logging.CRITICAL)}
+
         self._connect()
         self._create_tables()
+
+        # With use_async, writes happen on a background thread so emit() never
+        # waits on the database; rows are inserted with executemany and
+        # committed per batch. Without it each record is written by emit().
+        if use_async and self.connection:
+            # emit() appends without locking: deque.append is atomic and
+            # Handler.handle() already serializes producers. The lock only
+            # guards the writer's pops and the rare overflow eviction.
+            self._queue = deque()
+            self._lock = threading.Lock()
+            self._done = threading.Condition(self._lock)
+            self._wakeup = threading.Event()
+            self._in_flight = False
+            self._stop = threading.Event()
+            self._worker = threading.Thread(
+                target=self._drain, name="DatabaseHandler", daemon=True
+            )
+            self._worker.start()
     
     def _get_default_port(self):
         """Get default port for database type."""
@@ -1759,7 +1927,13 @@ class DatabaseHandler(logging.Handler):
                 )
             elif self.db_type == 'sqlite':
                 import sqlite3
-                self.connection = sqlite3.connect(self.database)
+                # The connection is created here but used by the writer thread.
+                self.connection = sqlite3.connect(self.database, check_same_thread=False)
+                if self.sqlite_wal:
+                    # WAL + synchronous=NORMAL: commits no longer fsync the main
+                    # database file, so each batch costs one cheap WAL append.
+                    self.connection.execute("PRAGMA journal_mode=WAL")
+                    self.connection.execute("PRAGMA synchronous=NORMAL")
             else:
                 raise ValueError(f"Unsupported database type: {self.db_type}")
         except ImportError as e:
@@ -1838,6 +2012,68 @@ class DatabaseHandler(logging.Handler):
             cursor.close()
         except Exception as e:
             logging.error(f"Failed to create log tables: {e}")
+            return
+        
+        try:
+            cursor = self.connection.cursor()
+            for statement in self._fanout_trigger_sql():
+                cursor.execute(statement)
+            self.connection.commit()
+            cursor.close()
+            self._fanout_trigger = True
+        except Exception as e:
+            # Without the trigger every row is inserted twice from Python.
+            self.connection.rollback()
+            logging.warning(f"Failed to create log_syslog trigger, using direct inserts: {e}")
+    
+    def _fanout_trigger_sql(self):
+        """Build the statements for the trigger copying log_syslog rows to level tables.
+        
+        Rows are routed on the level name; unknown levels go to log_info.
+        """
+        table_levels = {}
+        for levelno, table in LEVEL_TO_TABLE.items():
+            name = logging.getLevelName(levelno).replace("'", "''")
+            table_levels.setdefault(table, []).append(f"'{name}'")
+        other_levels = ", ".join(
+            name for table, names in table_levels.items() if table != 'log_info' for name in names
+        )
+        
+        columns = ", ".join(self.COLUMNS)
+        values = ", ".join(f"NEW.{column}" for column in self.COLUMNS)
+        
+        if self.db_type == 'sqlite':
+            body = "".join(
+                f"INSERT INTO {table} ({columns}) SELECT {values} WHERE NEW.level IN ({', '.join(names)});\n"
+                for table, names in table_levels.items() if table != 'log_info'
+            )
+            body += f"INSERT INTO log_info ({columns}) SELECT {values} WHERE NEW.level NOT IN ({other_levels});\n"
+            return [
+                "DROP TRIGGER IF EXISTS log_syslog_fanout",
+                f"CREATE TRIGGER log_syslog_fanout AFTER INSERT ON log_syslog FOR EACH ROW BEGIN\n{body}END",
+            ]
+        
+        elseif = "ELSIF" if self.db_type == 'postgresql' else "ELSEIF"
+        branches = [
+            f"NEW.level IN ({', '.join(names)}) THEN INSERT INTO {table} ({columns}) VALUES ({values});"
+            for table, names in table_levels.items() if table != 'log_info'
+        ]
+        body = "IF " + f"\n{elseif} ".join(branches)
+        body += f"\nELSE INSERT INTO log_info ({columns}) VALUES ({values});\nEND IF;"
+        
+        if self.db_type == 'postgresql':
+            return [
+                f"CREATE OR REPLACE FUNCTION log_syslog_fanout() RETURNS trigger AS $$\n"
+                f"BEGIN\n{body}\nRETURN NULL;\nEND;\n$$ LANGUAGE plpgsql",
+                "DROP TRIGGER IF EXISTS log_syslog_fanout ON log_syslog",
+                "CREATE TRIGGER log_syslog_fanout AFTER INSERT ON log_syslog "
+                "FOR EACH ROW EXECUTE PROCEDURE log_syslog_fanout()",
+            ]
+        # mysql / mariadb
+        return [
+            "DROP TRIGGER IF EXISTS log_syslog_fanout",
+            f"CREATE TRIGGER log_syslog_fanout AFTER INSERT ON log_syslog FOR EACH ROW BEGIN\n{body}\nEND",
+        ]
     
     def emit(self, record):
         """Emit log record to database."""
@@ -1845,8 +2081,6 @@ class DatabaseHandler(logging.Handler):
             return
         
         try:
-            cursor = self.connection.cursor()
-            
             data = (
                 datetime.fromtimestamp(record.created),
                 record.levelname,
@@ -1860,39 +2094,118 @@ class DatabaseHandler(logging.Handler):
                 record.thread,
             )
             
-            if self.db_type == 'postgresql':
-                sql = """
-                    INSERT INTO {} (timestamp, level, logger, message, module, function, 
-                                  lineno, pathname, process, thread)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """
-            elif self.db_type in ('mysql', 'mariadb'):
-                sql = """
-                    INSERT INTO {} (timestamp, level, logger, message, module, function,
-                                  lineno, pathname, process, thread)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """
-            else:  # sqlite
-                sql = """
-                    INSERT INTO {} (timestamp, level, logger, message, module, function,
-                                  lineno, pathname, process, thread)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """
-            
-            level_table = LEVEL_TO_TABLE.get(record.levelno, 'log_info')
-            cursor.execute(sql.format(level_table), data)
-            cursor.execute(sql.format('log_syslog'), data)
+            if self._queue is None:
+                self._write_batch([data])
+                return
             
-            self.connection.commit()
-            cursor.close()
+            if len(self._queue) >= self.queue_size:
+                with self._lock:
+                    if not self._make_room(record.levelno):
+                        self.dropped_count += 1
+                        return
+            self._queue.append(data)
+            if not self._wakeup.is_set():
+                self._wakeup.set()
         except Exception as e:
             logging.error(f"Failed to write log to database: {e}")
             self.handleError(record)
     
+    def _make_room(self, levelno):
+        """Evict the oldest lower-priority row so an ERROR-or-above record fits.
+        
+        Called with ``self._lock`` held. Returns False when the new record
+        should be dropped instead (it is below ERROR, or the queue only holds
+        preserved records).
+        """
+        if levelno < logging.ERROR:
+            return False
+        for index, row in enumerate(self._queue):
+            if row[1] not in self._preserved_levels:
+                del self._queue[index]
+                self.dropped_count += 1
+                return True
+        return False
+    
+    def _drain(self):
+        """Writer thread: pop queued rows and insert them in batches."""
+        while True:
+            self._wakeup.wait()
+            # Clear before draining so a record appended meanwhile sets it again.
+            self._wakeup.clear()
+            
+            while True:
+                with self._lock:
+                    if not self._queue:
+                        break
+                    batch = [self._queue.popleft() for _ in range(min(len(self._queue), self.batch_size))]
+                    self._in_flight = True
+                
+                try:
+                    self._write_batch(batch)
+                except Exception as e:
+                    logging.error(f"Failed to write log to database: {e}")
+                finally:
+                    with self._lock:
+                        self._in_flight = False
+                        self._done.notify_all()
+            
+            if self._stop.is_set():
+                return
+    
+    def _write_batch(self, batch):
+        """Insert a list of row tuples and commit once."""
+        cursor = self.connection.cursor()
+        if self.db_type == 'sqlite':
+            # Take the write lock up front instead of upgrading mid-batch.
+            cursor.execute("BEGIN IMMEDIATE")
+        try:
+            self._insert_rows(cursor, batch)
+        except Exception:
+            self.connection.rollback()
+            cursor.close()
+            raise
+        
+        self.connection.commit()
+        cursor.close()
+    
+    def _insert_rows(self, cursor, batch):
+        """Insert into log_syslog, and into the level tables when there is no trigger."""
+        cursor.executemany(self._syslog_sql, batch)
+        
+        if not self._fanout_trigger:
+            # Same routing as the trigger: by level name, unknown -> log_info.
+            rows_by_table = {}
+            for data in batch:
+                level_table = self._table_by_level.get(data[1], 'log_info')
+                rows_by_table.setdefault(level_table, []).append(data)
+            for level_table, rows in rows_by_table.items():
+                cursor.executemany(self._insert_sql[level_table], rows)
+    
+    def get_stats(self):
+        """Return queue metrics: records waiting to be written and records dropped."""
+        return {
+            'queued': len(self._queue) if self._queue is not None else 0,
+            'dropped': self.dropped_count,
+        }
+    
+    def flush(self):
+        """Block until every queued record has been written."""
+        if self._worker is not None and self._worker.is_alive():
+            with self._lock:
+                while self._queue or self._in_flight:
+                    self._done.wait(0.1)
+    
     def close(self):
-        """Close database connection."""
+        """Stop the writer thread, flush pending records and close the connection."""
+        if self._worker is not None:
+            self._stop.set()
+            self._wakeup.set()
+            self._worker.join()
+            self._worker = None
         if self.connection:
             self.connection.close()
+            self.connection = None
+        super().close()
 
 # ==================== Handler Classes ====================
 
@@ -1923,11 +2236,26 @@ class AnsiLogHandler(logging.StreamHandler):
         notice_color: str = '',        
         debug_color: str = '',        
         info_color: str = '',        
+        # write batching
+        buffered: bool = False,
+        buffer_records: int = 64,
+        buffer_bytes: int = 16384,
+        buffer_interval: float = 0.05,
 
         **kwargs
     ):
         super().__init__()
         
+        # With buffered=True lines are collected and written with a single
+        # write()/flush() once any of the limits below is reached.
+        self.buffered = buffered
+        self.buffer_records = buffer_records
+        self.buffer_bytes = buffer_bytes
+        self.buffer_interval = buffer_interval
+        self._buf = []
+        self._buf_bytes = 0
+        self._last_flush = time.monotonic()
+        
         self.lexer = lexer
         self.show_icon = show_icon
         self.icon_first = icon_first
@@ -1974,36 +2302,40 @@ class AnsiLogHandler(logging.StreamHandler):
                 # temporarily remove exc_info so formatter won't append traceback text
                 record.exc_info = None
                 record.exc_text = None
-            try:
-                # Get the original message
-                original_msg = record.getMessage()
-                if self.level_in_message:
-                    record.msg = f"{record.levelname} - {original_msg}"  # Change temporarily
-                msg = self.format(record)
-                
-            finally:
-                msg = self.format(record)
+            # Run msg % args once; the formatter and the highlighter share it
+            message = record.getMessage()
+            if self.level_in_message:
+                message = f"{record.levelname} - {message}"
             
             # Apply lexer highlighting if available
-            lexer_name = getattr(record, "lexer", None) or self.lexer
+            lexer_name = record.__dict__.get("lexer") or self.lexer
+            highlighted = None
             
             if lexer_name and PYGMENTS_AVAILABLE:
                 try:
-                    lexer_obj = get_lexer_by_name(lexer_name)  # type: ignore
-                    message_only = record.getMessage()
-                    highlighted = highlight(message_only, lexer_obj, TerminalFormatter()).rstrip()  # type: ignore
-                    # Replace message part in formatted string
-                    msg = msg.replace(message_only, highlighted)
+                    highlighted = _highlight_ansi(message, lexer_name)
                 except Exception:
                     pass
             
-            self.stream.write(msg + "\n")
-            self.flush()
+            # Hand the (highlighted) text to the formatter as the message itself
+            # rather than searching for the plain text in the output afterwards.
+            saved = record.msg, record.args
+            record.msg, record.args = highlighted if highlighted is not None else message, None
+            try:
+                msg = self.format(record)
+            finally:
+                record.msg, record.args = saved
+            
+            self._write(msg + "\n")
+            if self._buf and record.levelno >= logging.ERROR:
+                self.flush()
         except Exception:
             self.handleError(record)
             
         # Print ANSI-colored traceback once (if there was exc_info)
         if exc:
+            if self._buf:
+                self.flush()
             try:
                 # Use our ANSI traceback printer so exceptions are colored in ANSI mode
                 # print(f"self.show_background [1]: {self.show_background}")
@@ -2011,16 +2343,400 @@ class AnsiLogHandler(logging.StreamHandler):
             except Exception:
                 # final fallback: plain traceback
                 try:
-                    import traceback as _tb
-                    self.stream.write("".join(_tb.format_exception(*exc)) + "\n")
+                    self.stream.write("".join(traceback.format_exception(*exc)) + "\n")
                     self.flush()
                 except Exception:
                     pass
 
+    def _write(self, text):
+        """Write ``text`` now, or add it to the buffer when ``buffered`` is set."""
+        if not self.buffered:
+            self.stream.write(text)
+            self.flush()
+            return
+        
+        self._buf.append(text)
+        self._buf_bytes += len(text)
+        if (len(self._buf) >= self.buffer_records
+                or self._buf_bytes >= self.buffer_bytes
+                or time.monotonic() - self._last_flush >= self.buffer_interval):
+            self.flush()
+    
+    def flush(self):
+        """Write out buffered lines and flush the stream."""
+        # emit() already runs under self.lock (an RLock), so this nests safely.
+        with self.lock:
+            if self._buf:
+                self.stream.write("".join(self._buf))
+                self._buf.clear()
+                self._buf_bytes = 0
+            self._last_flush = time.monotonic()
+            super().flush()
+    
+    def close(self):
+        self.flush()
+        super().close()
+
+class _BufferedConsoleFile:
+    """Text stream wrapper that holds Rich Console output in memory.
+    
+    Rich calls ``flush()`` after every print; here that only writes through
+    once ``buffer_size`` characters are pending. :meth:`drain` forces it.
+    """
+
+    def __init__(self, stream, buffer_size=65536):
+        self._stream = stream
+        self.buffer_size = buffer_size
+        self._chunks = []
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def write(self, text):
+        with self._lock:
+            self._chunks.append(text)
+            self._size += len(text)
+        return len(text)
+
+    def flush(self):
+        if self._size >= self.buffer_size:
+            self.drain()
+
+    def drain(self):
+        """Write all pending output with a single write() and flush the stream."""
+        with self._lock:
+            if self._chunks:
+                self._stream.write("".join(self._chunks))
+                self._chunks.clear()
+                self._size = 0
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        # isatty(), fileno(), encoding, ... come from the real stream
+        return getattr(self._stream, name)
+
+class _TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes ``interval`` seconds after buffering starts.
+    
+    Records are passed to ``target`` in one batch once ``capacity`` is
+    reached, a record at ``flushLevel`` or above arrives, or the timer armed
+    by the first buffered record fires, so a quiet logger never sits on its
+    output for longer than ``interval``.
+    """
+
+    def __init__(self, capacity, target, flushLevel=logging.ERROR, interval=1.0):
+        super().__init__(capacity, flushLevel=flushLevel, target=target, flushOnClose=True)
+        self.interval = interval
+        self._timer = None
+
+    def emit(self, record):
+        try:
+            # Freeze the message now; the args may change before the flush.
+            snapshot = logging.makeLogRecord(record.__dict__)
+            snapshot.msg = record.getMessage()
+            snapshot.args = None
+            if record.exc_info:
+                if not snapshot.exc_text:
+                    formatter = self.target.formatter or logging.Formatter()
+                    snapshot.exc_text = formatter.formatException(record.exc_info)
+                snapshot.exc_info = None
+        except Exception:
+            self.handleError(record)
+            return
+        super().emit(snapshot)
+        if self.buffer and self._timer is None and self.interval:
+            self._timer = threading.Timer(self.interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            super().flush()
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler feeding a QueueListener in the same process.
+    
+    The stock ``prepare()`` formats the record and drops ``exc_info`` so it
+    can be pickled; the handlers behind the listener need the real
+    exception for rich tracebacks, so only the message is frozen here.
+    """
+
+    def prepare(self, record):
+        snapshot = logging.makeLogRecord(record.__dict__)
+        snapshot.msg = record.getMessage()
+        snapshot.args = None
+        return snapshot
+
+# Running QueueListener per logger name (see setup_logging(use_queue=True))
+_QUEUE_LISTENERS = {}
+
+def _stop_queue_listener(name):
+    """Stop the listener serving logger ``name``, writing out what it still holds."""
+    listener = _QUEUE_LISTENERS.pop(name, None)
+    if listener is not None:
+        listener.stop()
+
+def _attach_queue_listener(logger):
+    """Move ``logger``'s handlers behind a QueueHandler and a listener thread.
+    
+    Logging calls then only put the record on a ``queue.SimpleQueue``;
+    formatting and I/O for every handler happen on the listener's thread.
+    """
+    _stop_queue_listener(logger.name)
+    handlers = logger.handlers[:]
+    if not handlers:
+        return
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    logger.handlers.clear()
+    logger.addHandler(_LocalQueueHandler(log_queue))
+    _QUEUE_LISTENERS[logger.name] = listener
+    listener.start()
+
+@atexit.register
+def _stop_queue_listeners():
+    # Registered after logging's own hook, so this runs before logging.shutdown()
+    for name in list(_QUEUE_LISTENERS):
+        _stop_queue_listener(name)
+
+class _BackgroundRenderer:
+    """Run a handler's emit() on a daemon thread.
+    
+    The handler's ``emit`` is replaced by :meth:`put`, which only snapshots
+    the record and puts it on a ``queue.SimpleQueue``; Rich layout and
+    terminal writes happen on the render thread. Records arriving within
+    ``batch_interval`` seconds of each other (up to ``batch_size``) are
+    rendered together into one captured string and written with a single
+    write(). :meth:`flush` and :meth:`stop` queue a marker behind the
+    pending records and wait for the thread to reach it.
+    """
+    
+    def __init__(self, handler, batch_size=64, batch_interval=0.001):
+        self.handler = handler
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self._render = handler.emit
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="richcolorlog-render", daemon=True)
+        self._thread.start()
+        handler.emit = self.put
+    
+    def put(self, record):
+        if self.handler.console.quiet:
+            return
+        try:
+            # Freeze the message now; the args may change before it is rendered.
+            snapshot = logging.makeLogRecord(record.__dict__)
+            snapshot.msg = record.getMessage()
+            snapshot.args = None
+            self._queue.put(snapshot)
+        except Exception:
+            self.handler.handleError(record)
+    
+    def _run(self):
+        while True:
+            batch = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self.batch_interval
+            # Gather records until the batch is full, the window closes or a
+            # flush/stop marker (an Event, or None) comes up.
+            while isinstance(item, logging.LogRecord):
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    item = False
+                    break
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    item = False
+            try:
+                self._render_batch(batch)
+            except Exception:
+                # emit() reports its own errors; this covers capture/write failures
+                if batch:
+                    self.handler.handleError(batch[-1])
+            if item is None:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+    
+    def _render_batch(self, records):
+        """Render a burst of records with one write to the console's file."""
+        console = self.handler.console
+        if len(records) < 2 or console.is_jupyter or console.legacy_windows:
+            for record in records:
+                self._render(record)
+            return
+        
+        with console.capture() as capture:
+            for record in records:
+                self._render(record)
+        console.file.write(capture.get())
+        console.file.flush()
+    
+    def flush(self):
+        if self._thread.is_alive():
+            done = threading.Event()
+            self._queue.put(done)
+            done.wait()
+    
+    def stop(self):
+        """Render what is queued, stop the thread and restore synchronous emit()."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self.handler.__dict__.pop('emit', None)
+
+# Characters that make a short one-line message worth a Pygments pass.
+_CODE_CHARS = frozenset('{}()[]<>=:;"\'`#$@|&*/\\')
+
+def _looks_like_code(message, threshold=40):
+    """Cheap check whether ``message`` should go through Syntax highlighting.
+    
+    Long or multi-line messages always qualify; short single-line ones only
+    when they contain code punctuation, so plain sentences skip the lexer.
+    """
+    return len(message) > threshold or "\n" in message or not _CODE_CHARS.isdisjoint(message)
+
+# %(field)s / %(field)d / %(field)f placeholders in a format_template
+_PLACEHOLDER_RE = re.compile(r'%\((\w+)\)[sdf]')
+
+# LogRecord field -> component name used by the Rich handlers
+_FIELD_TO_INTERNAL = {
+    'asctime': 'time',
+    'created': 'created',
+    'filename': 'filename',
+    'funcName': 'funcname',
+    'levelname': 'level',
+    'levelno': 'levelno',
+    'lineno': 'lineno',
+    'message': 'message',
+    'module': 'module',
+    'msecs': 'msecs',
+    'name': 'name',
+    'pathname': 'pathname',
+    'process': 'process',
+    'processName': 'process_name',
+    'relativeCreated': 'relative_created',
+    'thread': 'thread',
+    'threadName': 'thread_name',
+    'icon': 'icon',
+    'type': 'type',
+}
+
+@lru_cache(maxsize=32)
+def _template_components(template):
+    """Return the components of ``template`` in order, in one regex pass.
+    
+    Names that aren't LogRecord fields are kept as-is so ``extra=`` values
+    can be placed in the template. The result is cached per template string
+    (handlers for many loggers usually share one), hence the tuple.
+    """
+    components = []
+    for match in _PLACEHOLDER_RE.finditer(template):
+        name = match.group(1)
+        component = _FIELD_TO_INTERNAL.get(name, name)
+        if component not in components:
+            components.append(component)
+    return tuple(components)
+
+# Components RichColorLogHandler builds itself rather than reading from extra=
+_BUILTIN_COMPONENTS = frozenset({
+    'time', 'name', 'process', 'thread', 'level', 'filename', 'lineno', 'pathname',
+    'funcname', 'module', 'process_name', 'thread_name', 'message', 'icon', 'type',
+})
+
+# LogRecord attributes (and handler-specific ones) never shown as extra fields
+_STANDARD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 'filename',
+    'module', 'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
+    'thread', 'threadName', 'processName', 'process', 'getMessage',
+    'exc_info', 'exc_text', 'stack_info', 'lexer', 'icon', 'tb',
+})
+
+# Numeric/path columns of the RichColorLogHandler grid
+_RIGHT_ALIGNED_COMPONENTS = frozenset({'filename', 'lineno', 'pathname', 'levelno', 'msecs', 'relative_created'})
+
+# Cell for a template component the record has no value for (e.g. an
+# extra= field it wasn't given); shared, Rich never modifies cell Texts.
+_BLANK_CELL = Text(" ") if RICH_AVAILABLE else None
+
+# Stands in for "%f" in per-second cached timestamps
+_USEC_MARK = "\x01"
+
+def _fast_truncate(text, width):
+    """Cut ``text`` to ``width`` cells with a trailing "..."; ASCII is just sliced."""
+    if text.isascii():
+        return text if len(text) <= width else text[:width - 3] + "..."
+    if cell_len(text) <= width:
+        return text
+    return set_cell_size(text, width - 3) + "..."
+
+def _syntax_lexer(name):
+    """Cached Pygments lexer instance for Syntax(); unknown names pass through.
+    
+    Syntax resolves a lexer given by name on every render, so the Rich
+    handlers hand it the instance from ``_get_lexer`` instead.
+    """
+    if PYGMENTS_AVAILABLE:
+        try:
+            return _get_lexer(name)
+        except Exception:
+            pass
+    return name
+
+@lru_cache(maxsize=16)
+def _syntax_theme(name):
+    """Shared Rich SyntaxTheme for a theme name.
+    
+    ``Syntax(theme="...")`` looks the Pygments style up again and starts an
+    empty token -> Style cache on every record; one instance per name keeps
+    both.
+    """
+    return Syntax.get_theme(name)
+
+def _datetime_formatter(log_time_format):
+    """Resolve ``log_time_format`` once into a ``datetime -> str`` callable."""
+    if callable(log_time_format):
+        return log_time_format
+    if isinstance(log_time_format, str):
+        return lambda dt: dt.strftime(log_time_format)
+    return str
+
+def _parse_style(style):
+    """Parse ``style`` once up front; theme names like ``log.time`` stay strings."""
+    try:
+        return Style.parse(style)
+    except Exception:
+        return style
+
+def _init_rich_handler(handler, level, console, extra, **options):
+    """Run RichHandler.__init__ with its own options in one call.
+    
+    RichHandler keeps most options as attributes itself; the layout switches
+    (show_time, show_level, ...) only go to its LogRender, so they are also
+    set on the handler for the custom emit() implementations.
+    """
+    try:
+        RichHandler.__init__(handler, level=level, console=console, **options, **extra)
+    except TypeError:
+        # Older Rich releases lack some traceback options; keep them as attributes.
+        legacy = {key: options.pop(key) for key in ('tracebacks_code_width', 'tracebacks_max_frames')}
+        RichHandler.__init__(handler, level=level, console=console, **options, **extra)
+        handler.__dict__.update(legacy)
+
+    handler.show_time = options['show_time']
+    handler.omit_repeated_times = options['omit_repeated_times']
+    handler.show_level = options['show_level']
+    handler.show_path = options['show_path']
+    handler.log_time_format = options['log_time_format']
+
 class RichColorLogHandler2(RichHandler):
     """Custom RichHandler with compact layout."""
 
-    LEVEL_STYLES = {
+    LEVEL_STYLES = MappingProxyType({
         logging.DEBUG: "bold #FFAA00",
         logging.INFO: "bold #00FFFF",
         logging.WARNING: "black on #FFFF00",  # ✅ Background
@@ -2030,7 +2746,21 @@ class RichColorLogHandler2(RichHandler):
         EMERGENCY_LEVEL: "bright_white on #AA00FF",  # ✅ Background
         ALERT_LEVEL: "bright_white on #005500",      # ✅ Background
         NOTICE_LEVEL: "black on #00FFFF",            # ✅ Background
-    }
+    })
+
+    # Used instead of LEVEL_STYLES when show_background=False
+    LEVEL_STYLES_NO_BG = MappingProxyType({
+        logging.DEBUG: "bold #FFAA00",
+        logging.INFO: "bold #00FFFF",
+        logging.SUCCESS: "bold #00FFFF",
+        logging.WARNING: "#FFFF00",          # ❌ No background
+        logging.ERROR: "red",                # ❌ No background
+        logging.CRITICAL: "bold #550000",    # ❌ No background
+        FATAL_LEVEL: "#0055FF",
+        EMERGENCY_LEVEL: "#AA00FF",
+        ALERT_LEVEL: "#005500",
+        NOTICE_LEVEL: "#00FFFF",
+    })
 
     def __init__(self,
         lexer=None,
@@ -2040,6 +2770,7 @@ class RichColorLogHandler2(RichHandler):
         icon_first=False,
         theme="fruity",
         format_template=None,
+        background=False,
         
         # RESTORE all RichHandler arguments:
         level: Union[int, str] = 'DEBUG',
@@ -2068,6 +2799,34 @@ class RichColorLogHandler2(RichHandler):
         **kwargs
     ):
 
+        # Remove custom params
+        for key in ["lexer", "show_background", "render_emoji", "show_icon", "icon_first", "theme", "background"]:
+            kwargs.pop(key, None)
+
+        _init_rich_handler(
+            self, level, console, kwargs,
+            show_time=show_time,
+            omit_repeated_times=omit_repeated_times,
+            show_level=show_level,
+            show_path=show_path,
+            enable_link_path=enable_link_path,
+            highlighter=highlighter,
+            markup=markup,
+            rich_tracebacks=rich_tracebacks,
+            tracebacks_width=tracebacks_width,
+            tracebacks_code_width=tracebacks_code_width,
+            tracebacks_extra_lines=tracebacks_extra_lines,
+            tracebacks_theme=tracebacks_theme,
+            tracebacks_word_wrap=tracebacks_word_wrap,
+            tracebacks_show_locals=tracebacks_show_locals,
+            tracebacks_suppress=tracebacks_suppress,
+            tracebacks_max_frames=tracebacks_max_frames,
+            locals_max_length=locals_max_length,
+            locals_max_string=locals_max_string,
+            log_time_format=log_time_format,
+            keywords=keywords,
+        )
+
         self.lexer = lexer
         self.show_background = show_background
         self.show_icon = show_icon
@@ -2076,59 +2835,33 @@ class RichColorLogHandler2(RichHandler):
         self._render_emoji_flag = render_emoji
         self.format_template = format_template
 
-        self.level = level 
-        self.console = console 
-        self.show_time = show_time 
-        self.omit_repeated_times = omit_repeated_times 
-        self.show_level = show_level 
-        self.show_path = show_path 
-        self.enable_link_path = enable_link_path 
-        self.highlighter = highlighter 
-        self.markup = markup 
-        self.rich_tracebacks = rich_tracebacks 
-        self.tracebacks_width = tracebacks_width 
-        self.tracebacks_code_width = tracebacks_code_width 
-        self.tracebacks_extra_lines = tracebacks_extra_lines 
-        self.tracebacks_theme = tracebacks_theme 
-        self.tracebacks_word_wrap = tracebacks_word_wrap 
-        self.tracebacks_show_locals = tracebacks_show_locals 
-        self.tracebacks_suppress = tracebacks_suppress 
-        self.tracebacks_max_frames = tracebacks_max_frames 
-        self.locals_max_length = locals_max_length 
-        self.locals_max_string = locals_max_string 
-        self.log_time_format = log_time_format 
-        self.keywords = keywords 
-        
-        # Remove custom params
-        for key in ["lexer", "show_background", "render_emoji", "show_icon", "icon_first", "theme"]:
-            kwargs.pop(key, None)
-
-        super().__init__(**kwargs)
-
-        self.markup = True
+        # Brackets stripped once; "%f" needs datetime, so it keeps the slow path.
+        time_fmt = log_time_format.strip("[]") if isinstance(log_time_format, str) else None
+        self._time_fmt = time_fmt if time_fmt and "%f" not in time_fmt else None
+        self._time_cache = (None, None)
+        self._format_datetime = _datetime_formatter(time_fmt if time_fmt is not None else log_time_format)
+        # Short plain messages skip Syntax even when a lexer is set.
+        self._syntax_threshold = 40
         
         # Update styles
         if not show_background:
-            self.LEVEL_STYLES = {
-                logging.DEBUG: "bold #FFAA00",
-                logging.INFO: "bold #00FFFF",
-                logging.SUCCESS: "bold #00FFFF",
-                logging.WARNING: "#FFFF00",          # ❌ No background
-                logging.ERROR: "red",                # ❌ No background
-                logging.CRITICAL: "bold #550000",    # ❌ No background
-                FATAL_LEVEL: "#0055FF",
-                EMERGENCY_LEVEL: "#AA00FF",
-                ALERT_LEVEL: "#005500",
-                NOTICE_LEVEL: "#00FFFF",
-            }
+            self.LEVEL_STYLES = self.LEVEL_STYLES_NO_BG
+
+        # Level styles parsed once for the per-record lookups
+        self._level_style_objs = {level: _parse_style(style) for level, style in self.LEVEL_STYLES.items()}
+
+        # (levelno, levelname, icon) -> Text, filled by get_level_text()
+        self._level_text_cache = {}
 
         if self.format_template:
             # print(f"DEBUG: Calling _parse_template with {self.format_template}")
             self._parse_template(self.format_template) 
         else:
-            if str(os.getenv('RICHCOLORLOG_DEBUG', '0')).lower() in ['1', 'true', 'True']:
+            if _DEBUG:
                 print(f"DEBUG: NOT calling _parse_template because format_template is {self.format_template}")
 
+        self._compile_render_steps()
+
         try:
             if hasattr(self, '_log_render'):
                 self._log_render.emojis = bool(self._render_emoji_flag)
@@ -2139,86 +2872,143 @@ class RichColorLogHandler2(RichHandler):
             icon_filter = IconFilter(icon_first=icon_first)
             self.addFilter(icon_filter)
 
+        # background=True moves rendering and printing to a daemon thread.
+        self._renderer = _BackgroundRenderer(self) if background else None
+
+    def flush(self):
+        if self._renderer is not None:
+            self._renderer.flush()
+        super().flush()
+
+    def close(self):
+        if self._renderer is not None:
+            self._renderer.stop()
+            self._renderer = None
+        super().close()
+
+    # component -> (LogRecord attribute, style) for the plain template fields
+    COMPONENT_FIELDS = {
+        'name': ('name', "cyan"),
+        'process': ('process', "magenta"),
+        'thread': ('thread', "magenta"),
+        'filename': ('filename', "log.path"),
+        'lineno': ('lineno', "log.path"),
+        'pathname': ('pathname', "dim"),
+        'funcname': ('funcName', "blue"),
+    }
+
+    def _compile_render_steps(self):
+        """Build the tuple of callables emit() runs to fill the output line.
+        
+        Each step is called as ``step(record, output, message)``.
+        ``_message_index`` is the position of the message step, so emit() can
+        print non-Text messages (Syntax) after the steps before it.
+        """
+        def space(record, output, message):
+            output.append(" ")
+
+        def time_step(record, output, message):
+            output.append(self.get_time_text(record))
+
+        def level_step(record, output, message):
+            level_text = self.get_level_text(record)
+            output.append(level_text)
+            padding = 12 - len(level_text)
+            if padding > 0:
+                output.pad_right(padding)
+
+        def message_step(record, output, message):
+            output.append(message)
+
+        def path_step(record, output, message):
+            output.append(Text(f"{record.filename}:{record.lineno}", style="log.path"))
+
+        def field_step(attr, style):
+            def step(record, output, message):
+                output.append(Text(str(getattr(record, attr)), style=style))
+            return step
+
+        steps = []
+        self._has_message = True
+        components = getattr(self, 'template_components', None) if self.format_template else None
+        if components:
+            for index, component in enumerate(components):
+                # the level column is already padded
+                if index and components[index - 1] != 'level':
+                    steps.append(space)
+                if component == 'message':
+                    self._message_index = len(steps)
+                    steps.append(message_step)
+                elif component == 'time':
+                    steps.append(time_step)
+                elif component == 'level':
+                    steps.append(level_step)
+                else:
+                    steps.append(field_step(*self.COMPONENT_FIELDS[component]))
+            if 'message' not in components:
+                self._message_index = len(steps)
+                self._has_message = False
+        else:
+            if self.show_time:
+                steps.extend((time_step, space))
+            steps.append(level_step)
+            self._message_index = len(steps)
+            steps.append(message_step)
+            if self.show_path:
+                steps.extend((space, path_step))
+
+        self._render_steps = tuple(steps)
+
     def _parse_template(self, template):
         """Parse Template format to determine components and orders."""
-        self.template_components = []
-        
-        # Map format string to component name
-        component_map = {
-            '%(asctime)s': 'time',
-            '%(name)s': 'name',
-            '%(process)d': 'process',
-            '%(levelname)s': 'level',
-            '%(message)s': 'message',
-            '%(filename)s': 'filename',
-            '%(lineno)d': 'lineno',
-            '%(pathname)s': 'pathname',
-            '%(funcName)s': 'funcname',
-            '%(thread)d': 'thread',
-        }
-        
-        # Detect order dari template
-        for pattern, component in component_map.items():
-            if pattern in template:
-                pos = template.find(pattern)
-                self.template_components.append((pos, component))
-        
-        # Sort based on position
-        self.template_components.sort(key=lambda x: x[0])
-        self.template_components = [comp for pos, comp in self.template_components]
+        supported = {'time', 'level', 'message'} | set(self.COMPONENT_FIELDS)
+        self.template_components = [
+            component for component in _template_components(template) if component in supported
+        ]
 
     def get_level_text(self, record):
-        """Override untuk compact level text."""
+        """Override untuk compact level text.
+        
+        The Text is built once per level/icon and shared, so callers must not modify it.
+        """
         
         level_name = record.levelname
-        style = self.LEVEL_STYLES.get(record.levelno, "")
         
         # Icon handling
-        icon = getattr(record, 'icon', "")
-        if icon and self.icon_first:
-            level_text = Text(f"{icon} {level_name}", style=style)
-        else:
-            level_text = Text(level_name, style=style)
+        icon = record.__dict__.get('icon', "") if self.icon_first else ""
+        key = (record.levelno, level_name, icon)
+        level_text = self._level_text_cache.get(key)
+        if level_text is None:
+            style = self._level_style_objs.get(record.levelno, "")
+            if icon:
+                level_text = Text(f"{icon} {level_name}", style=style)
+            else:
+                level_text = Text(level_name, style=style)
+            self._level_text_cache[key] = level_text
         
         return level_text
 
     def emit(self, record):
         """Override emit untuk custom layout yang lebih compact."""
+        # A quiet console drops everything, so don't lay the record out
+        if self.console.quiet:
+            return
         try:
-            # Get message
-            message = self.render_message(record, record.getMessage())
+            # Get message (templates without %(message)s skip formatting it)
+            message = self.render_message(record, record.getMessage()) if self._has_message else None
             
-            # Get level with icon
-            level_text = self.get_level_text(record)
-            
-            # Get path (compact)
-            path_text = Text(f"{record.filename}:{record.lineno}", style="log.path")
-            
-            # Build compact layout dengan Table
             output = Text()
+            steps = self._render_steps
             
-            # Time (optional)
-            if self.show_time:
-                log_time = self.get_time_text(record)
-                output.append(log_time)
-                output.append(" ")
-            
-            # Level + icon (fixed width)
-            output.append(level_text)
-            output.append(" " * (12 - len(level_text.plain)))  # Padding
-            
-            # Message
-            if isinstance(message, (Text, str)):
-                output.append(message)
+            if message is None or isinstance(message, (Text, str)):
+                for step in steps:
+                    step(record, output, message)
             else:
                 # Syntax or Rich renderable
+                for step in steps[:self._message_index]:
+                    step(record, output, message)
                 self.console.print(output, message)
                 return
-
-            # Path at last (compact, no excessive spacing)
-            if self.show_path:
-                output.append(" ")
-                output.append(path_text)
             
             # Print to console
             self.console.print(output)
@@ -2229,27 +3019,31 @@ class RichColorLogHandler2(RichHandler):
     def get_time_text(self, record):
         if self.formatter:
             log_time = self.formatter.formatTime(record, self.log_time_format)
+        elif self._time_fmt:
+            # Format straight from the epoch seconds and reuse the Text while
+            # the second doesn't change (bursts share one timestamp).
+            second = int(record.created)
+            cached_second, cached_text = self._time_cache
+            if cached_second == second:
+                return cached_text
+            time_text = Text(time.strftime(self._time_fmt, time.localtime(second)), style="log.time")
+            self._time_cache = (second, time_text)
+            return time_text
         else:
-            ct = datetime.fromtimestamp(record.created)
-            if isinstance(self.log_time_format, str):
-                log_time = ct.strftime(self.log_time_format.strip("[]"))
-            elif callable(self.log_time_format):
-                log_time = self.log_time_format(ct)
-            else:
-                log_time = str(ct)
+            log_time = self._format_datetime(datetime.fromtimestamp(record.created))
 
         return Text(f"{log_time}", style="log.time")
 
     def render_message(self, record, message):
-        lexer_name = getattr(record, "lexer", None) or self.lexer
-        style = self.LEVEL_STYLES.get(record.levelno, "")
+        lexer_name = record.__dict__.get("lexer") or self.lexer
+        style = self._level_style_objs.get(record.levelno, "")
 
-        if lexer_name:
+        if lexer_name and _looks_like_code(str(message), self._syntax_threshold):
             try:
                 syntax = Syntax(
                     str(message),
-                    lexer_name,
-                    theme=self.theme,
+                    _syntax_lexer(lexer_name),
+                    theme=_syntax_theme(self.theme),
                     line_numbers=False,
                     word_wrap=True,
                 )
@@ -2291,6 +3085,9 @@ class RichColorLogHandler(RichHandler):
         theme="fruity",
         format_template=None,
         level_in_message: bool = False,
+        background: bool = False,
+        buffered: bool = False,
+        buffer_size: int = 65536,
         
         # RESTORE all RichHandler arguments:
         level: Union[int, str] = 'DEBUG',
@@ -2331,73 +3128,66 @@ class RichColorLogHandler(RichHandler):
 
         **kwargs
     ):
-        # --- keep your assignments ---
+        # Remove custom params from kwargs
+        for key in ["lexer", "show_background", "render_emoji", "show_icon", "icon_first", "theme", "level_in_message", "show_type", "background", "buffered", "buffer_size"]:
+            kwargs.pop(key, None)
+
+        # ✅ FIX: Ensure console is properly initialized
+        if console is None:
+            # buffered=True keeps output in memory until the buffer fills, an
+            # ERROR+ record arrives or the handler is flushed.
+            console = Console(file=_BufferedConsoleFile(sys.stdout, buffer_size) if buffered else None)
+        self._console_buffer = console.file if isinstance(console.file, _BufferedConsoleFile) else None
+
+        # Pass All Arguments to Parent Richhandler
+        _init_rich_handler(
+            self, level, console, kwargs,
+            show_time=show_time,
+            omit_repeated_times=omit_repeated_times,
+            show_level=show_level,
+            show_path=show_path,
+            enable_link_path=enable_link_path,
+            highlighter=highlighter,
+            markup=markup,
+            rich_tracebacks=rich_tracebacks,
+            tracebacks_width=tracebacks_width,
+            tracebacks_code_width=tracebacks_code_width,
+            tracebacks_extra_lines=tracebacks_extra_lines,
+            tracebacks_theme=tracebacks_theme,
+            tracebacks_word_wrap=tracebacks_word_wrap,
+            tracebacks_show_locals=tracebacks_show_locals,
+            tracebacks_suppress=tracebacks_suppress,
+            tracebacks_max_frames=tracebacks_max_frames,
+            locals_max_length=locals_max_length,
+            locals_max_string=locals_max_string,
+            log_time_format=log_time_format,
+            keywords=keywords,
+        )
+
         self.lexer = lexer
         self.show_background = show_background
         self.show_icon = show_icon
         self.icon_first = icon_first
         self.theme = theme
         self._render_emoji_flag = render_emoji
-        self.format_template = format_template
         self.format_template = format_template.strip() if format_template else format_template
         self.level_in_message = level_in_message
         self._last_shown_time = None
-
-        self.level = level
-
-        # ✅ FIX: Ensure console is properly initialized
-        if console is None:
-            from rich.console import Console
-            self.console = Console()
-        else:
-            self.console = console
-
-        self.show_time = show_time
-        self.omit_repeated_times = omit_repeated_times
-        self.show_level = show_level
-        self.show_path = show_path
-        self.enable_link_path = enable_link_path
-        self.highlighter = highlighter
-        self.markup = markup
-
-
-        self.rich_tracebacks = rich_tracebacks
-        if str(os.getenv('RICHCOLORLOG_DEBUG', '0')).lower() in ['1', 'true', 'True']:
-            print(f"rich_tracebacks      [00]: {rich_tracebacks}")
-            print(f"self.rich_tracebacks [00]: {self.rich_tracebacks}")
-        
-        self.tracebacks_width = tracebacks_width
-        self.tracebacks_code_width = tracebacks_code_width
-        self.tracebacks_extra_lines = tracebacks_extra_lines
-        self.tracebacks_theme = tracebacks_theme
-        self.tracebacks_word_wrap = tracebacks_word_wrap
-        self.tracebacks_show_locals = tracebacks_show_locals
-        self.tracebacks_suppress = tracebacks_suppress
-        self.tracebacks_max_frames = tracebacks_max_frames
-        self.locals_max_length = locals_max_length
-        self.locals_max_string = locals_max_string
-        self.log_time_format = log_time_format
-        self.keywords = keywords
-
         self.show_type = show_type
 
-        # Remove custom params from kwargs
-        for key in ["lexer", "show_background", "render_emoji", "show_icon", "icon_first", "theme", "level_in_message", "show_type"]:
-            kwargs.pop(key, None)
-
-        # Pass All Arguments to Parent Richhandler
-        # ✅ FIX: Pass console to parent if it expects it
-        try:
-            super().__init__(console=self.console, **kwargs)
-        except TypeError:
-            # Fallback if parent doesn't accept console parameter
-            super().__init__(**kwargs)
-
-        self.markup = True
-
-        self.level_styles = dict(self.LEVEL_STYLES)
+        # strftime runs once per second; a "%f" is kept as a marker in the
+        # cached string and filled in from record.created.
+        if isinstance(log_time_format, str) and not ("%f" in log_time_format and "%%" in log_time_format):
+            self._time_fmt = log_time_format.replace("%f", _USEC_MARK)
+        else:
+            self._time_fmt = None
+        self._time_usec = self._time_fmt is not None and _USEC_MARK in self._time_fmt
+        self._format_datetime = _datetime_formatter(log_time_format)
+        self._time_cache_sec = -1
+        self._time_cache_val = None
+        # Short plain messages skip Syntax even when a lexer is set.
+        self._syntax_threshold = 40
 
-        
         COLORS = Colors(
             color_type='rich',
             show_background=self.show_background,
@@ -2425,8 +3215,16 @@ class RichColorLogHandler(RichHandler):
             NOTICE_LEVEL: COLORS['notice'],
         }
 
+        # Styles are parsed once here, not per record.
+        self._level_style_objs = {level: _parse_style(style) for level, style in self.LEVEL_STYLES.items()}
+        self._styles = {
+            name: _parse_style(name)
+            for name in ("cyan", "magenta", "blue", "green", "dim", "dim italic", "log.path", "log.time")
+        }
+        # (levelno, levelname) -> finished level cell, filled by _level_cell()
+        self._level_text_cache = {}
 
-        if str(os.getenv('RICHCOLORLOG_DEBUG', '0')).lower() in ['1', 'true', 'True']:
+        if _DEBUG:
             print(f"DEBUG INIT: format_template={format_template}")
             print(f"DEBUG INIT: self.format_template={self.format_template}")
             print("DEBUG INIT: FORMAT TEMPLATE =", repr(self.format_template))
@@ -2434,7 +3232,7 @@ class RichColorLogHandler(RichHandler):
         if self.format_template:
             self._parse_template(self.format_template) 
         else:
-            if str(os.getenv('RICHCOLORLOG_DEBUG', '0')).lower() in ['1', 'true', 'True']:
+            if _DEBUG:
                 print(f"DEBUG: NOT calling _parse_template because format_template is {self.format_template}")
 
         # Enable emoji
@@ -2451,10 +3249,122 @@ class RichColorLogHandler(RichHandler):
             self.addFilter(icon_filter)
 
         self.rich_tracebacks = rich_tracebacks
-        if str(os.getenv('RICHCOLORLOG_DEBUG', '0')).lower() in ['1', 'true', 'True']:
+        if _DEBUG:
             print(f"rich_tracebacks [0]: {rich_tracebacks}")
             print(f"self.rich_tracebacks [0]: {self.rich_tracebacks}")
 
+        self._build_components_order()
+        self._component_builders = self._make_component_builders()
+        # (component, builder) pairs for the plain cells this column order uses
+        self._needed_builders = tuple(
+            (comp, self._component_builders[comp])
+            for comp in self._components_order if comp in self._component_builders
+        )
+
+        # background=True moves rendering and printing to a daemon thread.
+        self._renderer = _BackgroundRenderer(self) if background else None
+
+    def flush(self):
+        if self._renderer is not None:
+            self._renderer.flush()
+        if self._console_buffer is not None:
+            self._console_buffer.drain()
+        super().flush()
+
+    def close(self):
+        if self._renderer is not None:
+            self._renderer.stop()
+            self._renderer = None
+        if self._console_buffer is not None:
+            self._console_buffer.drain()
+        super().close()
+
+    def _make_component_builders(self):
+        """Map each plain record-field component to a function building its cell.
+        
+        Cells carry their trailing separator space, so numbers go through one
+        f-string and the row builder doesn't append to them afterwards.
+        """
+        styles = self._styles
+        return {
+            'name': lambda record: Text(f"{record.name} ", style=styles["cyan"]),
+            'process': lambda record: Text(f"{record.process} ", style=styles["magenta"]),
+            'thread': lambda record: Text(f"{record.thread} ", style=styles["magenta"]),
+            'level': self._level_cell,
+            'filename': lambda record: Text(f"{record.filename} ", style=styles["log.path"]),
+            'lineno': lambda record: Text(f"{record.lineno} ", style=styles["log.path"]),
+            'pathname': lambda record: Text(f"{record.pathname} ", style=styles["dim"]),
+            'funcname': lambda record: Text(f"{record.funcName} ", style=styles["blue"]),
+            'module': lambda record: Text(f"{record.module} ", style=styles["green"]),
+            'process_name': lambda record: Text(f"{record.processName} ", style=styles["magenta"]),
+            'thread_name': lambda record: Text(f"{record.threadName} ", style=styles["magenta"]),
+        }
+
+    def _level_cell(self, record):
+        # Shared between rows; the separator stays unstyled so level
+        # backgrounds end at the padded name.
+        key = (record.levelno, record.levelname)
+        level_text = self._level_text_cache.get(key)
+        if level_text is None:
+            level_text = Text.assemble(
+                (record.levelname.ljust(8), self._level_style_objs.get(record.levelno, "")), " "
+            )
+            self._level_text_cache[key] = level_text
+        return level_text
+
+    def _build_components_order(self):
+        """Resolve the column order once from the template and show_* flags."""
+        if hasattr(self, 'template_components') and self.template_components:
+            components_order = self.template_components.copy()
+
+            if self.show_icon:
+                if 'icon' in components_order:
+                    components_order.remove('icon')
+                if self.icon_first:
+                    components_order.insert(0, 'icon')
+                else:
+                    try:
+                        msg_idx = components_order.index('message')
+                        components_order.insert(msg_idx, 'icon')
+                    except ValueError:
+                        components_order.append('icon')
+        else:
+            components_order = []
+            if self.show_icon and self.icon_first:
+                components_order.append('icon')
+            if self.show_time:
+                components_order.append('time')
+            if self.show_level:
+                components_order.append('level')
+            components_order.append('message')
+            if self.show_type:
+                components_order.append('type')
+            if self.show_path:
+                components_order.extend(['filename', 'lineno'])
+            if self.show_icon and not self.icon_first:
+                components_order.append('icon')
+
+        self._components_order = tuple(components_order)
+        # Template placeholders filled from extra= values on the record
+        self._extra_components = tuple(
+            comp for comp in self._components_order
+            if comp not in _BUILTIN_COMPONENTS and comp not in _STANDARD_ATTRS
+        )
+
+        self._table = self._new_table()
+
+    def _new_table(self):
+        """Build the empty grid whose columns follow the format template."""
+        table = Table.grid(padding=(0), pad_edge=False, expand=True)
+        for comp in self._components_order:
+            if comp == 'message':
+                table.add_column(justify="left", ratio=1)
+            elif comp in _RIGHT_ALIGNED_COMPONENTS:
+                table.add_column(justify="right", no_wrap=True)
+            else:
+                table.add_column(justify="left", no_wrap=True)
+        return table
+
     def _is_traceback_string(self, message: str) -> bool:
         """
         Detect if message contains a traceback string.
@@ -2525,8 +3435,8 @@ class RichColorLogHandler(RichHandler):
             # Create syntax highlighted traceback
             syntax = Syntax(
                 message,
-                "pytb",  # Python traceback lexer
-                theme=self.tracebacks_theme or "monokai",
+                _syntax_lexer("pytb"),  # Python traceback lexer
+                theme=_syntax_theme(self.tracebacks_theme or "monokai"),
                 line_numbers=False,
                 word_wrap=self.tracebacks_word_wrap,
                 code_width=self.tracebacks_width,
@@ -2555,43 +3465,9 @@ class RichColorLogHandler(RichHandler):
 
     def _parse_template(self, template):
         """Parse Template format with explicit mapping."""
-        self.template_components = []
-        
-        # Explicit Mapping - Must be exactly like this
-        mapping = {
-            '%(asctime)s': 'time',
-            '%(created)f': 'created',
-            '%(filename)s': 'filename',
-            '%(funcName)s': 'funcname',
-            '%(levelname)s': 'level',
-            '%(levelno)d': 'levelno',
-            '%(lineno)d': 'lineno',
-            '%(message)s': 'message',
-            '%(module)s': 'module',
-            '%(msecs)d': 'msecs',
-            '%(name)s': 'name',
-            '%(pathname)s': 'pathname',
-            '%(process)d': 'process',
-            '%(processName)s': 'process_name',
-            '%(relativeCreated)d': 'relative_created',
-            '%(thread)d': 'thread',
-            '%(threadName)s': 'thread_name',
-            '%(icon)s': 'icon',
-            '%(type)s': 'type',
-        }
+        self.template_components = list(_template_components(template))
 
-        # Find the position of each placeholder in the template
-        matches = []
-        for placeholder, internal_name in mapping.items():
-            pos = template.find(placeholder)
-            if pos != -1:
-                matches.append((pos, internal_name))
-
-        # Sort by position
-        matches.sort(key=lambda x: x[0])
-        self.template_components = [name for pos, name in matches]
-
-        if str(os.getenv('RICHCOLORLOG_DEBUG', '0')).lower() in ['1', 'true', 'True']:
+        if _DEBUG:
             print(f"DEBUG: Template: {template!r}")
             print(f"DEBUG: Parsed components: {self.template_components}")
             print("DEBUG: Searching for '%(asctime)s' in:", repr(template))
@@ -2602,7 +3478,7 @@ class RichColorLogHandler(RichHandler):
         
         if padding_left == None:
             padding_left = 0
-        terminal_width = shutil.get_terminal_size()[0]
+        terminal_width = _terminal_width()
         icon = emoji + ' ' if show_emoji else ' '
         timestamp = ''
         # Timestamp
@@ -2623,11 +3499,11 @@ class RichColorLogHandler(RichHandler):
         tb_text = Text("\n".join([padding_left *' ' if padding_left else 4 *' ' +  i for i in tb_string.split("\n")]), style="#00FFFF")
         
         
-        self.console.print(Text(icon) + Text(padding_left *' ') + type_text if not show_datetime else type_text, end='')
+        self.console.print(Text.assemble(icon, padding_left * ' ', type_text) if not show_datetime else type_text, end='')
         self.console.print(" : ", end='')
         #if not padding_left: padding_left = 4
         self.console.print(value_text)
-        self.console.print(Text(padding_left *' ') + tb_text)
+        self.console.print(Text.assemble(padding_left * ' ', tb_text))
         if not padding_left:
             padding_left = 4
             self.console.print(f"[bold]{timestamp}[/bold] - ", end='') if timestamp else None
@@ -2638,185 +3514,152 @@ class RichColorLogHandler(RichHandler):
             self.console.print("-" * terminal_width)
 
     def emit(self, record):
-        if str(os.getenv('RICHCOLORLOG_DEBUG', '0')).lower() in ['1', 'true', 'True']:
+        if _DEBUG:
             print("RichColorLogHandler -> emit -> calling ...")
         """Emit log record with proper traceback handling."""
-        if str(os.getenv('RICHCOLORLOG_DEBUG', '0')).lower() in ['1', 'true', 'True']:
+        if _DEBUG:
             print(f"DEBUG: show_icon={self.show_icon}, icon_first={self.icon_first}")
             print(f"DEBUG: template_components={getattr(self, 'template_components', [])}")
             print(f"DEBUG: filename={record.filename}, lineno={record.lineno}")
             print(f"DEBUG: pathname={record.pathname}")
             print(f"DEBUG: exc_info={record.exc_info}")  # Added for debugging
 
+        # A quiet console drops everything, so don't lay the record out
+        if self.console.quiet:
+            return
+
         try:
-            lexer_name = getattr(record, "lexer", None) or self.lexer
-            has_lexer = lexer_name is not None
+            lexer_name = record.__dict__.get("lexer") or self.lexer
         
             original_message = record.getMessage()
+            has_lexer = lexer_name is not None and _looks_like_code(original_message, self._syntax_threshold)
         
             # ✅ NEW: Check if message contains Django/DRF traceback
             is_traceback_msg = self._is_traceback_string(original_message)
             
-            s_type = getattr(record, "type", None)
-            
             # === Build all_components ===
-            all_components = {}
-            
-            # Standard fields
-            dt = datetime.fromtimestamp(record.created)
-            log_time: Optional[str] = self.log_time_format(dt) if callable(self.log_time_format) else dt.strftime(self.log_time_format)  # type: ignore
-
-            should_show_time = True
-            if self.omit_repeated_times:
-                if self._last_shown_time == log_time:
-                    should_show_time = False
+            # Only the cells the column order asks for are built.
+            components_order = self._components_order
+            all_components = {comp: build(record) for comp, build in self._needed_builders}
+
+            styles = self._styles
+            if 'time' in components_order:
+                # Standard fields
+                if self._time_fmt:
+                    # Records in the same second share one formatted timestamp.
+                    second = int(record.created)
+                    if second != self._time_cache_sec:
+                        self._time_cache_val = time.strftime(self._time_fmt, time.localtime(second))
+                        self._time_cache_sec = second
+                    log_time: Optional[str] = self._time_cache_val
+                    if self._time_usec:
+                        log_time = log_time.replace(_USEC_MARK, f"{int(record.created % 1 * 1000000):06d}")
                 else:
-                    self._last_shown_time = log_time
+                    log_time = self._format_datetime(datetime.fromtimestamp(record.created))
+
+                should_show_time = True
+                if self.omit_repeated_times:
+                    if self._last_shown_time == log_time:
+                        should_show_time = False
+                    else:
+                        self._last_shown_time = log_time
 
-            # Save the length of time for padding later
-            time_width = len(log_time) if log_time else 0
+                # Save the length of time for padding later
+                time_width = len(log_time) if log_time else 0
 
-            if should_show_time:
-                all_components['time'] = Text(log_time, style="log.time")
-            else:
-                all_components['time'] = Text(" " * time_width, style="log.time")
-
-            all_components['name'] = Text(record.name, style="cyan")
-            all_components['process'] = Text(str(record.process), style="magenta")
-            all_components['thread'] = Text(str(record.thread), style="magenta")
-            all_components['level'] = Text(f"{record.levelname:8s}", style=self.LEVEL_STYLES.get(record.levelno, ""))
-            all_components['filename'] = Text(record.filename, style="log.path")
-            all_components['lineno'] = Text(str(record.lineno), style="log.path")
-            all_components['pathname'] = Text(record.pathname, style="dim")
-            all_components['funcname'] = Text(record.funcName, style="blue")
-            all_components['module'] = Text(record.module, style="green")
-            all_components['process_name'] = Text(record.processName, style="magenta")
-            all_components['thread_name'] = Text(record.threadName, style="magenta")
+                if should_show_time:
+                    all_components['time'] = Text(f"{log_time} ", style=styles["log.time"])
+                else:
+                    all_components['time'] = Text(" " * (time_width + 1), style=styles["log.time"])
             
             # Message
-            original_message = record.getMessage()
-            if self.level_in_message and not has_lexer:
-                enhanced_message = f"{record.levelname} - {original_message}"
-            else:
-                enhanced_message = original_message
-                # print(f"enhanced_message: {enhanced_message}")
-
-            # ✅ NEW: Don't render full traceback in message if it will be rendered separately
-            if is_traceback_msg:
-                # Extract just the first line for the table
-                first_line = original_message.split('\n')[0]
-                if len(first_line) > 100:
-                    first_line = first_line[:97] + "..."
-                all_components['message'] = Text(first_line + " [dim](see traceback below)[/dim]", style="red")
-            elif has_lexer:
-                if record.exc_info:
-                    # If there is exc_info, avoid duplicating traceback in message
-                    all_components['message'] = Text(f"{record.getMessage().splitlines()[0]} (see traceback below)", style=self.LEVEL_STYLES.get(record.levelno, ""))
+            if 'message' in components_order:
+                if self.level_in_message and not has_lexer:
+                    enhanced_message = f"{record.levelname} - {original_message}"
                 else:
-                    all_components['message'] = Text("")
-            else:
-                all_components['message'] = self.render_message(record, enhanced_message)
+                    enhanced_message = original_message
+
+                # ✅ NEW: Don't render full traceback in message if it will be rendered separately
+                if is_traceback_msg:
+                    # Extract just the first line for the table
+                    first_line = _fast_truncate(original_message.partition('\n')[0], 100)
+                    all_components['message'] = Text(first_line + " [dim](see traceback below)[/dim]", style="red")
+                elif has_lexer:
+                    if record.exc_info:
+                        # If there is exc_info, avoid duplicating traceback in message
+                        first_line = original_message.partition('\n')[0].rstrip('\r')
+                        all_components['message'] = Text(f"{first_line} (see traceback below)", style=self._level_style_objs.get(record.levelno, ""))
+                    else:
+                        all_components['message'] = Text("")
+                else:
+                    all_components['message'] = self.render_message(record, enhanced_message)
             
             # === Icon: Always prepare if show_icon = true ===
-            if self.show_icon:
-                icon_str = getattr(record, 'icon', "")
-                all_components['icon'] = Text(icon_str) if icon_str else Text("")
-            else:
-                all_components['icon'] = Text("")
+            if 'icon' in components_order:
+                icon_str = record.__dict__.get('icon', "") if self.show_icon else ""
+                all_components['icon'] = Text(f"{icon_str} ")
 
-            if self.show_type:
-                all_components['type'] = Text(" type: " + str(type(original_message).__name__))
-            else:
-                all_components['type'] = Text("")
+            if 'type' in components_order:
+                if self.show_type:
+                    all_components['type'] = Text(f" type: {type(original_message).__name__} ")
+                else:
+                    all_components['type'] = _BLANK_CELL
 
             # === Custom Field from record.__dict__ ===
-            standard_attrs = {
-                'name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 'filename',
-                'module', 'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
-                'thread', 'threadName', 'processName', 'process', 'getMessage',
-                'exc_info', 'exc_text', 'stack_info', 'lexer', 'icon', 'tb'
-            }
-            for key, value in record.__dict__.items():
-                if key not in standard_attrs and key not in all_components:
-                    all_components[key] = Text(str(value), style="dim italic")
-
-            # === Determine the sequence of components ===
-            if hasattr(self, 'template_components') and self.template_components:
-                components_order = self.template_components.copy()
-                
-                if self.show_icon:
-                    if 'icon' in components_order:
-                        components_order.remove('icon')
-                    if self.icon_first:
-                        components_order.insert(0, 'icon')
-                    else:
-                        try:
-                            msg_idx = components_order.index('message')
-                            components_order.insert(msg_idx, 'icon')
-                        except ValueError:
-                            components_order.append('icon')
-            else:
-                components_order = []
-                if self.show_icon and self.icon_first:
-                    components_order.append('icon')
-                if self.show_time:
-                    components_order.append('time')
-                if self.show_level:
-                    components_order.append('level')
-                components_order.append('message')
-                if self.show_type:
-                    components_order.append('type')
-                if self.show_path:
-                    components_order.extend(['filename', 'lineno'])
-                if self.show_icon and not self.icon_first:
-                    components_order.append('icon')
+            if self._extra_components:
+                record_dict = record.__dict__
+                for key in self._extra_components:
+                    if key in record_dict:
+                        all_components[key] = Text(f"{record_dict[key]} ", style=styles["dim italic"])
 
             # === Build table ===
-            table = Table.grid(padding=(0), pad_edge=False, expand=True)
-            for comp in components_order:
-                if comp == 'message':
-                    table.add_column(justify="left", ratio=1)
-                elif comp in ['filename', 'lineno', 'pathname', 'levelno', 'msecs', 'relative_created']:
-                    table.add_column(justify="right", no_wrap=True)
-                else:
-                    table.add_column(justify="left", no_wrap=True)
+            # The grid and its columns are built once; only the row is replaced.
+            # Rendering happens either under the handler lock or on the single
+            # background render thread, so the grid is never used concurrently.
+            # Resetting relies on Rich's private Column._cells; if a Rich
+            # release drops it, fall back to a fresh grid per record.
+            table = self._table
+            if all(hasattr(column, '_cells') for column in table.columns):
+                table.rows.clear()
+                for column in table.columns:
+                    column._cells.clear()
+            else:
+                table = self._new_table()
 
+            # Every cell but the message already ends with its separator space
             row = []
-            for i, comp in enumerate(components_order):
-                if comp in all_components:
-                    text_obj = all_components[comp]
-                    if comp != 'message':
-                        text_obj.append(" ")
-                    row.append(text_obj)
-                else:
-                    row.append(Text(" "))
+            for comp in components_order:
+                cell = all_components.get(comp)
+                row.append(_BLANK_CELL if cell is None else cell)
 
             table.add_row(*row)
-            self.console.print(table)
 
-            if str(os.getenv('RICHCOLORLOG_DEBUG', '0')).lower() in ['1', 'true', 'True']:
+            if _DEBUG:
                 print(f"is_traceback_msg [1]: {is_traceback_msg}")
                 print(f"self.rich_tracebacks [1]: {self.rich_tracebacks}")
             
             # ✅ PRIORITY 1: Handle Django/DRF traceback string (most common in Django)
             if is_traceback_msg and self.rich_tracebacks:
+                self.console.print(table)
                 self._render_traceback_string(original_message)
             
             # ✅ PRIORITY 2: Handle syntax highlighting for lexer
             # === Syntax highlighting if there is a lexer ===
-            elif has_lexer:
+            # The header row and the code block go out in a single print.
+            elif has_lexer and not record.exc_info:
                 try:
                     syntax = Syntax(
-                        str(record.getMessage()), 
-                        lexer_name, 
-                        theme=self.theme,
+                        original_message, 
+                        _syntax_lexer(lexer_name),
+                        theme=_syntax_theme(self.theme),
                         line_numbers=False,
                         word_wrap=True,
                     )
-                    if not record.exc_info:
-                        self.console.print(syntax)
+                    self.console.print(Group(table, syntax))
                 except Exception:
-                    self.console.print(f"    {record.getMessage()}")
+                    self.console.print(Group(table, Text(f"    {original_message}")))
+            else:
+                self.console.print(table)
             
             # ✅ PRIORITY 3.1: Handle normal Python exception with exc_info
             if record.exc_info:       
@@ -2824,14 +3667,11 @@ class RichColorLogHandler(RichHandler):
                     self._print_traceback_rich(record.exc_info, padding_left=0, show_datetime=True, show_emoji=True, emoji=Icon.err if hasattr(Icon, 'err') else "❌ ")
                 except Exception:
                     print(traceback.format_exc())
-                    import traceback as tb
-                    exc_text = ''.join(tb.format_exception(*record.exc_info))
+                    exc_text = ''.join(traceback.format_exception(*record.exc_info))
                     self.console.print(Text(exc_text, style="red"))
             # ✅ PRIORITY 3.2: Handle normal Python exception with exc_info
             elif record.exc_info and self.rich_tracebacks:
                 try:
-                    from rich.traceback import Traceback
-                    
                     exc_type, exc_value, exc_tb = record.exc_info
                     
                     # Build traceback object with all configured options
@@ -2855,19 +3695,20 @@ class RichColorLogHandler(RichHandler):
                     
                 except Exception as e:
                     # Fallback: print standard traceback if Rich fails
-                    import traceback as tb
                     self.console.print(
                         f"[red]Error rendering rich traceback: {e}[/red]"
                     )
                     self.console.print(
-                        Text(tb.format_exc(), style="red")
+                        Text(traceback.format_exc(), style="red")
                     )
             
             # ✅ PRIORITY 4: Fallback for exc_info without rich_tracebacks
             elif record.exc_info and not self.rich_tracebacks:
-                import traceback as tb
-                exc_text = ''.join(tb.format_exception(*record.exc_info))
+                exc_text = ''.join(traceback.format_exception(*record.exc_info))
                 self.console.print(Text(exc_text, style="red"))
+
+            if self._console_buffer is not None and record.levelno >= logging.ERROR:
+                self._console_buffer.drain()
                 
         except Exception:
             self.handleError(record)
@@ -2875,19 +3716,19 @@ class RichColorLogHandler(RichHandler):
     def render_message(self, record, message):
         """Render message with syntax highlighting and style level."""
         
-        if str(os.getenv('RICHCOLORLOG_DEBUG', '0')).lower() in ['1', 'true', 'True']:
+        if _DEBUG:
             print("RichColorLogHandler -> render_message -> calling ...")
 
-        lexer_name = getattr(record, "lexer", None) or self.lexer
-        style = self.LEVEL_STYLES.get(record.levelno, "")
+        lexer_name = record.__dict__.get("lexer") or self.lexer
+        style = self._level_style_objs.get(record.levelno, "")
         
         # If there is a lexer, use syntax (color from lexer, not level)
-        if lexer_name:
+        if lexer_name and _looks_like_code(str(message), self._syntax_threshold):
             try:
                 return Syntax(
                     str(message), 
-                    lexer_name, 
-                    theme=self.theme,
+                    _syntax_lexer(lexer_name), 
+                    theme=_syntax_theme(self.theme),
                     line_numbers=False,
                     word_wrap=False,
                 )
@@ -2992,7 +3833,7 @@ def setup_logging_custom(
         os.environ['NO_LOGGING'] = '1'
         logging.basicConfig(level=logging.CRITICAL)
 
-    if _check_logging_disabled():
+    if _is_logging_disabled():
         return logging.getLogger()
 
     logger = logging.getLogger(name)
@@ -3085,6 +3926,8 @@ def setup_logging(
     log_file_level: Union[str, int] = logging.INFO,
     max_bytes: Union[int, None] = 10485760,
     backup_count: Union[int, None] = 5,
+    log_file_buffer: int = 0,
+    log_file_flush_interval: float = 1.0,
 
     # RabbitMQ
     rabbitmq=False,
@@ -3144,6 +3987,9 @@ def setup_logging(
 
     show_type: bool = False,        
 
+    use_queue: bool = False,
+    buffer_capacity: int = 0,
+
 ) -> logging.Logger:
     """
     Setup enhanced logging with Rich formatting and multiple output handlers.
@@ -3151,6 +3997,7 @@ def setup_logging(
     Returns:
         logging.Logger: Configured logger instance
     """
+    config_key = _config_key(locals())
     # print(f"omit_repeated_times: {omit_repeated_times}")
     if exceptions is None:
         exceptions = []
@@ -3165,7 +4012,7 @@ def setup_logging(
         os.environ['NO_LOGGING'] = '1'
         logging.basicConfig(level=logging.CRITICAL)
 
-    #if _check_logging_disabled():
+    #if _is_logging_disabled():
         #return logging.getLogger(name)
 
     if exceptions:
@@ -3177,7 +4024,12 @@ def setup_logging(
     logger.__class__ = CustomLogger
     logger.setLevel(level)
 
+    # Same arguments as the call that built the current handlers: keep them
+    if _has_config(logger, config_key):
+        return logger
+
     # Clear existing handlers
+    _stop_queue_listener(logger.name)
     logger.handlers.clear()
 
     # if basic: logging.basicConfig(level=level)
@@ -3208,14 +4060,27 @@ def setup_logging(
         )
         file_handler.setLevel(log_file_level)
 
-        if str(os.getenv('RICHCOLORLOG_DEBUG', '0')).lower() in ['1', 'true', 'yes']: print(f"icon_first: {icon_first}")
+        if _DEBUG: print(f"icon_first: {icon_first}")
 
         if icon_first:
             icon_filter = IconFilter(icon_first=True)
             file_handler.addFilter(icon_filter)
 
         file_handler.setFormatter(LevelBasedFileFormatter())
-        logger.addHandler(file_handler)
+
+        if log_file_buffer and log_file_buffer > 1:
+            # Batch writes; ERROR and above, the interval timer, and
+            # logging.shutdown() at exit all flush the buffer.
+            buffered_handler = _TimedMemoryHandler(
+                log_file_buffer,
+                file_handler,
+                flushLevel=logging.ERROR,
+                interval=log_file_flush_interval,
+            )
+            buffered_handler.setLevel(log_file_level)
+            logger.addHandler(buffered_handler)
+        else:
+            logger.addHandler(file_handler)
     
     if name and not format_template:
         format_template = "%(asctime)s %(name)s %(levelname)s %(message)s (%(filename)s:%(lineno)d)"
@@ -3264,7 +4129,8 @@ def setup_logging(
             notice_color=notice_color,
             debug_color=debug_color,
             info_color=info_color,
-            show_type=show_type
+            show_type=show_type,
+            buffered=buffer_capacity > 0,
 
         )
 
@@ -3280,7 +4146,7 @@ def setup_logging(
             rich_handler.addFilter(icon_filter)
 
         logger.addHandler(rich_handler)
-    elif isinstance(HANDLER, (list or tuple)):
+    elif isinstance(HANDLER, (list, tuple)) and (RICH_AVAILABLE or HANDLER):
         if RichColorLogHandler not in HANDLER:
             if RICH_AVAILABLE:
                 rich_handler = RichColorLogHandler(
@@ -3325,7 +4191,8 @@ def setup_logging(
                     notice_color=notice_color,
                     debug_color=debug_color,
                     info_color=info_color,
-                    show_type=show_type
+                    show_type=show_type,
+                    buffered=buffer_capacity > 0,
 
                 )
 
@@ -3362,6 +4229,8 @@ def setup_logging(
             notice_color=notice_color,
             debug_color=debug_color,
             info_color=info_color,
+            buffered=buffer_capacity > 0,
+            buffer_records=buffer_capacity or 64,
         )
         logger.addHandler(console_handler)
     
@@ -3445,10 +4314,44 @@ def setup_logging(
     if name:
         logger.propagate = False
     
-    if str(os.getenv('RICHCOLORLOG_DEBUG', '0')).lower() in ['1', 'true', 'yes']: print(f"LOGGER.HANDLERS: {logger.handlers}")
+    if use_queue:
+        _attach_queue_listener(logger)
+    
+    _mark_config(logger, config_key)
+    
+    if _DEBUG: print(f"LOGGER.HANDLERS: {logger.handlers}")
     
     return logger
 
+def _freeze(value):
+    """Hashable stand-in for a setup argument; unhashable objects count by identity."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    try:
+        hash(value)
+    except TypeError:
+        return ('id', id(value))
+    return value
+
+def _config_key(arguments):
+    """Fingerprint of a setup function's arguments (pass ``locals()`` first thing)."""
+    return tuple((name, _freeze(value)) for name, value in arguments.items())
+
+def _has_config(logger, config_key):
+    """True if every handler on ``logger`` was installed by a call with ``config_key``."""
+    handlers = logger.handlers
+    return bool(handlers) and all(
+        getattr(handler, '_richcolorlog_config', None) == config_key for handler in handlers
+    )
+
+def _mark_config(logger, config_key):
+    for handler in logger.handlers:
+        handler._richcolorlog_config = config_key
+
 def get_def() -> str:
     """Get current function/class definition name for logging context."""
     name = ''
@@ -3518,7 +4421,8 @@ def getLogger(*args, **kwargs):
     return setup_logging(*args, **kwargs)
 
 def getLoggerSimple(name=None, show_icon=True, icon_first=False, 
-                    show_background=True, level=logging.DEBUG):
+                    show_background=True, level=logging.DEBUG, use_queue=False,
+                    buffer_capacity=0):
     """
     Simple logger without Rich - perfect for IPython/Jupyter.
     Uses basic ANSI colors, no async issues.
@@ -3529,16 +4433,22 @@ def getLoggerSimple(name=None, show_icon=True, icon_first=False,
         icon_first (bool): Icon before datetime
         show_background (bool): Background colors
         level (int): Logging level
+        use_queue (bool): Write from a QueueListener thread instead of the caller's
+        buffer_capacity (int): Lines collected per write; 0 writes each record at once
         
     Returns:
         logging.Logger: Simple configured logger
     """
+    config_key = _config_key(locals())
     _configure_ipython_logging()
     
     logging.setLoggerClass(CustomLogger)
     
     logger = logging.getLogger(name)
     logger.setLevel(level)
+    if _has_config(logger, config_key):
+        return logger
+    _stop_queue_listener(logger.name)
     logger.handlers.clear()
     
     handler = AnsiLogHandler(
@@ -3550,74 +4460,90 @@ def getLoggerSimple(name=None, show_icon=True, icon_first=False,
         show_pid=False,
         show_level=False,
         show_icon=show_icon,
+        buffered=buffer_capacity > 0,
+        buffer_records=buffer_capacity or 64,
     )
     logger.addHandler(handler)
     logger.propagate = False
     
+    if use_queue:
+        _attach_queue_listener(logger)
+    
+    _mark_config(logger, config_key)
+    
     return logger
 
 # ==================== Test Functions ====================
 
+# Methods the demo functions call, most severe first
+_TEST_LEVELS = (
+    ('emergency', EMERGENCY_LEVEL),
+    ('alert', ALERT_LEVEL),
+    ('critical', logging.CRITICAL),
+    ('error', logging.ERROR),
+    ('warning', logging.WARNING),
+    ('notice', NOTICE_LEVEL),
+    ('info', logging.INFO),
+    ('debug', logging.DEBUG),
+)
+
+def _banner(text, sgr="3"):
+    """Print a demo section header, wrapped in the SGR code ``sgr`` on a color terminal.
+    
+    Plain escape codes, not Rich markup: these are fixed strings and don't
+    need the markup parser or a console render. The line goes out in a
+    single write (print() writes the text and the newline separately).
+    """
+    if console is not None and console.is_terminal and not console.no_color:
+        text = f"\x1b[{sgr}m{text}\x1b[0m"
+    sys.stdout.write(text + "\n")
+    sys.stdout.flush()
+
+_third_party_configured = False
+
+def _configure_third_party_loggers():
+    """Route urllib3/requests/chardet records to the root handlers, once per process."""
+    global _third_party_configured
+    if _third_party_configured:
+        return
+    for name in ("urllib3", "requests", "chardet"):
+        lg = logging.getLogger(name)
+        lg.handlers.clear()
+        lg.propagate = True
+        lg.setLevel(logging.DEBUG)
+    _third_party_configured = True
+
+def _log_each_level(logger, message="This is {article} {name} message", levels=_TEST_LEVELS):
+    """Log ``message`` once per level, skipping levels the logger filters out."""
+    for name, level in levels:
+        if logger.isEnabledFor(level):
+            article = "an" if name[0] in "aeiou" else "a"
+            getattr(logger, name)(message.format(name=name, Name=name.capitalize(), article=article))
+
 def test1():
     """Test function to verify logger setup with different configurations."""
-    logger = setup_logging_custom()
-    
-    if console:
-        console.print("[italic]Test function to verify logger setup (CustomFormatter).[/]\n")
-    else:
-        print("Test function to verify logger setup (CustomFormatter).\n")
-    
-    logger.emergency("This is an emergency message")
-    logger.alert("This is an alert message")
-    logger.critical("This is a critical message")
-    logger.error("This is an error message")
-    logger.warning("This is a warning message")
-    logger.notice("This is a notice message")
-    logger.info("This is an info message")
-    logger.debug("This is a debug message")
-    print("=" * shutil.get_terminal_size()[0])
-    
+    sections = [
+        (setup_logging_custom, {}, "Test function to verify logger setup (CustomFormatter).\n"),
+    ]
     if RICH_AVAILABLE:
-        logger = setup_logging(log_file=True, log_file_level='DEBUG')
-        
-        if console:
-            console.print("[italic]Test function (CustomRichFormatter) with File Logging.[/]\n")
-        else:
-            print("Test function (CustomRichFormatter) with File Logging.\n")
-        
-        logger.emergency("This is an emergency message")
-        logger.alert("This is an alert message")
-        logger.critical("This is a critical message")
-        logger.error("This is an error message")
-        logger.warning("This is a warning message")
-        logger.notice("This is a notice message")
-        logger.info("This is an info message")
-        logger.debug("This is a debug message - will have detailed format in file")
-        print("=" * shutil.get_terminal_size()[0])
-        
-        logger = setup_logging(show_background=False)
-        
-        if console:
-            console.print("[italic]Test function (CustomRichFormatter), No Background.[/]\n")
-        else:
-            print("Test function (CustomRichFormatter), No Background.\n")
-        
-        logger.emergency("This is an emergency message")
-        logger.alert("This is an alert message")
-        logger.critical("This is a critical message")
-        logger.error("This is an error message")
-        logger.warning("This is a warning message")
-        logger.notice("This is a notice message")
-        logger.info("This is an info message")
-        logger.debug("This is a debug message")
+        sections += [
+            (setup_logging, dict(log_file=True, log_file_level='DEBUG'),
+             "Test function (CustomRichFormatter) with File Logging.\n"),
+            (setup_logging, dict(show_background=False),
+             "Test function (CustomRichFormatter), No Background.\n"),
+        ]
+    
+    for index, (factory, kwargs, title) in enumerate(sections):
+        if index:
+            print("=" * _terminal_width())
+        logger = factory(**kwargs)
+        _banner(title)
+        _log_each_level(logger)
 
 
 def test_brokers():
     """Test message broker handlers."""
-    if console:
-        console.print("\n[bold cyan]Testing Message Broker Handlers[/]\n")
-    else:
-        print("\nTesting Message Broker Handlers\n")
+    _banner("\nTesting Message Broker Handlers\n", "1;36")
     
     logger = setup_logging(
         name='broker_test',
@@ -3626,26 +4552,12 @@ def test_brokers():
         log_file_name='broker_test.log',
     )
     
-    if console:
-        console.print("[yellow]Testing all log levels with brokers...[/]\n")
-    else:
-        print("Testing all log levels with brokers...\n")
-    
-    logger.debug("Debug message - testing brokers")
-    logger.info("Info message - testing brokers")
-    logger.notice("Notice message - testing brokers")
-    logger.warning("Warning message - testing brokers")
-    logger.error("Error message - testing brokers")
-    logger.critical("Critical message - testing brokers")
-    logger.alert("Alert message - testing brokers")
-    logger.emergency("Emergency message - testing brokers")
-    
-    if console:
-        console.print("\n[green]Broker tests completed![/]")
-        console.print("[dim]Note: Enable specific brokers by passing parameters to setup_logging()[/]\n")
-    else:
-        print("\nBroker tests completed!")
-        print("Note: Enable specific brokers by passing parameters to setup_logging()\n")
+    _banner("Testing all log levels with brokers...\n", "33")
+    
+    _log_each_level(logger, "{Name} message - testing brokers", reversed(_TEST_LEVELS))
+    
+    _banner("\nBroker tests completed!", "32")
+    _banner("Note: Enable specific brokers by passing parameters to setup_logging()\n", "2")
 
 
 def test_lexer():
@@ -3711,7 +4623,7 @@ def run_test():
         print(f"Result: {result}")
     
     print()
-    print("=" * shutil.get_terminal_size()[0])
+    print("=" * _terminal_width())
     print("Check log file 'app.log' for file logging output.")
     print("DEBUG level logs will have detailed format with process/thread info.\n")
 
@@ -3733,38 +4645,44 @@ def run_test():
     root_logger.addHandler(handler)
     root_logger.setLevel(logging.DEBUG)
 
-    try:
-        import requests
-        
-        logging.getLogger("urllib3").setLevel(logging.DEBUG)
-        resp = requests.get("https://httpbin.org/get", timeout=5)
-        print(f"Response status: {resp.status_code}")
-    except ImportError:
-        print("Requests library not available. Skipping requests test.")
-    except Exception as e:
-        print(f"Error during requests test: {e}")
+    # The requests examples hit httpbin.org; opt in so offline/CI runs don't wait on it
+    network = str(os.getenv('RICHCOLORLOG_NETWORK_TESTS', '0')).lower() in ('1', 'true', 'yes', 'ok')
+
+    if not network:
+        print("Skipping requests test (set RICHCOLORLOG_NETWORK_TESTS=1 to enable).")
+    else:
+        _configure_third_party_loggers()
+        try:
+            import requests
+            
+            logging.getLogger("urllib3").setLevel(logging.DEBUG)
+            resp = requests.get("https://httpbin.org/get", timeout=5)
+            print(f"Response status: {resp.status_code}")
+        except ImportError:
+            print("Requests library not available. Skipping requests test.")
+        except Exception as e:
+            print(f"Error during requests test: {e}")
     
     print()
     print("Example usage of setup_logging for default logger:\n")
     
     logger = setup_logging(level='DEBUG', show_background=True)
 
-    for name in ("urllib3", "requests", "chardet"):
-        lg = logging.getLogger(name)
-        lg.handlers.clear()
-        lg.propagate = True
-        lg.setLevel(logging.DEBUG)
+    _configure_third_party_loggers()
 
-    try:
-        import requests
-        
-        logging.getLogger("urllib3").setLevel(logging.DEBUG)
-        resp = requests.get("https://httpbin.org/get", timeout=5)
-        logger.info("Request completed with status %s", resp.status_code)
-    except ImportError:
-        logger.info("Requests library not available for final test")
-    except Exception as e:
-        logger.error("Error during final requests test: %s", e)
+    if not network:
+        logger.info("Skipping final requests test (RICHCOLORLOG_NETWORK_TESTS not set)")
+    else:
+        try:
+            import requests
+            
+            logging.getLogger("urllib3").setLevel(logging.DEBUG)
+            resp = requests.get("https://httpbin.org/get", timeout=5)
+            logger.info("Request completed with status %s", resp.status_code)
+        except ImportError:
+            logger.info("Requests library not available for final test")
+        except Exception as e:
+            logger.error("Error during final requests test: %s", e)
     
     # Test broker handlers
     test_brokers()
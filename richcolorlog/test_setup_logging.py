@@ -5,90 +5,96 @@
 # Description: 
 # License: MIT
 
-import os
-from logger import setup_logging
+import logging
+import shutil
 
-print("Test function (CustomFormatter), No Background Color.\n")
-FORMAT = "%(icon)s %(asctime)s - %(name)s - %(process)d - %(levelname)s - %(message)s (%(filename)s:%(lineno)d)"
-logger = setup_logging(show_background=False, format_template=FORMAT, name="TEST [1]")
+try:
+    from logger import setup_logging, _log_each_level, NOTICE_LEVEL, EMERGENCY_LEVEL, ALERT_LEVEL
+except ImportError:
+    from richcolorlog.logger import setup_logging, _log_each_level, NOTICE_LEVEL, EMERGENCY_LEVEL, ALERT_LEVEL
 
-logger.critical("This is a critical message")
-logger.error("This is an error message")
-logger.warning("This is a warning message")
-logger.notice("This is a notice message")
-logger.info("This is an info message")
-logger.debug("This is a debug message")
-logger.emergency("This is a emergency message")
-logger.alert("This is a alert message")
-logger.fatal("This is a fatal message")
+LEVELS = (
+    ("critical", logging.CRITICAL),
+    ("error", logging.ERROR),
+    ("warning", logging.WARNING),
+    ("notice", NOTICE_LEVEL),
+    ("info", logging.INFO),
+    ("debug", logging.DEBUG),
+    ("emergency", EMERGENCY_LEVEL),
+    ("alert", ALERT_LEVEL),
+    ("fatal", logging.FATAL),
+)
+SEPARATOR = "=" * (shutil.get_terminal_size()[0] - 3)
 
-print("\n", "="*(os.get_terminal_size()[0] - 3), "\n")
+def main():
+    print("Test function (CustomFormatter), No Background Color.\n")
+    FORMAT = "%(icon)s %(asctime)s - %(name)s - %(process)d - %(levelname)s - %(message)s (%(filename)s:%(lineno)d)"
+    logger = setup_logging(show_background=False, format_template=FORMAT, name="TEST [1]")
 
-print("Test function (CustomFormatter), Background Color.\n")
+    _log_each_level(logger, levels=LEVELS)
 
-logger = setup_logging(show_background=True, format_template=FORMAT, name="TEST [2]", level_in_message=True)
+    print("\n", SEPARATOR, "\n")
 
-logger.critical("This is a critical message")
-logger.error("This is an error message")
-logger.warning("This is a warning message")
-logger.notice("This is a notice message")
-logger.info("This is an info message")
-logger.debug("This is a debug message")
-logger.emergency("This is a emergency message")
-logger.alert("This is a alert message")
-logger.fatal("This is a fatal message")
+    print("Test function (CustomFormatter), Background Color.\n")
 
-# print("Test function (CustomFormatter), LEXER + No Background Color.\n")
-print("\n", "="*(os.get_terminal_size()[0] - 3), "\n")
+    logger = setup_logging(show_background=True, format_template=FORMAT, name="TEST [2]", level_in_message=True)
 
-print("Test function (CustomFormatter), LEXER\n")
+    _log_each_level(logger, levels=LEVELS)
 
-logger = setup_logging(show_background=False, format_template=FORMAT, name="TEST [3]")
+    # print("Test function (CustomFormatter), LEXER + No Background Color.\n")
+    print("\n", SEPARATOR, "\n")
 
+    print("Test function (CustomFormatter), LEXER\n")
 
-code = """
-    def hello():
-        print("Hello World")
-    """
+    logger = setup_logging(show_background=False, format_template=FORMAT, name="TEST [3]")
 
-logger.info(code, lexer='python')  # Will be highlighted as a python code
-logger.debug("SELECT * FROM users", lexer='sql')  # Will be highlighted as SQL
 
-print("\n", "="*(os.get_terminal_size()[0] - 3), "\n")
+    code = """
+        def hello():
+            print("Hello World")
+        """
 
-print("\nTest function (CustomFormatter), LEXER + Background Color.\n")
+    logger.info(code, lexer='python')  # Will be highlighted as a python code
+    logger.debug("SELECT * FROM users", lexer='sql')  # Will be highlighted as SQL
 
-logger = setup_logging(show_background=True, format_template=FORMAT, name="TEST [4]")
+    print("\n", SEPARATOR, "\n")
 
+    print("\nTest function (CustomFormatter), LEXER + Background Color.\n")
 
-code = """
-    def hello():
-        print("Hello World")
-    """
+    logger = setup_logging(show_background=True, format_template=FORMAT, name="TEST [4]")
 
-logger.info(code, lexer='python')  # Will be highlighted as a python code
-logger.debug("SELECT * FROM users", lexer='sql')  # Will be highlighted as SQL
 
+    code = """
+        def hello():
+            print("Hello World")
+        """
 
-print("\n", "="*(os.get_terminal_size()[0] - 3), "\n")
+    logger.info(code, lexer='python')  # Will be highlighted as a python code
+    logger.debug("SELECT * FROM users", lexer='sql')  # Will be highlighted as SQL
 
-print("Test function (CustomFormatter) + No Background + custom variable format \n")
 
+    print("\n", SEPARATOR, "\n")
 
-FORMAT="%(asctime)s [%(levelname)s] %(name)s | user=%(user_id)s | %(message)s"
-logger = setup_logging(show_background=False, format_template=FORMAT, name="TEST [5]")
+    print("Test function (CustomFormatter) + No Background + custom variable format \n")
 
-# Logging with custom field fields
-logger.info("User logged in", extra={"user_id": "U12345"})
 
-print("\n", "="*(os.get_terminal_size()[0] - 3), "\n")
+    FORMAT="%(asctime)s [%(levelname)s] %(name)s | user=%(user_id)s | %(message)s"
+    logger = setup_logging(show_background=False, format_template=FORMAT, name="TEST [5]")
 
-print("Test function (CustomFormatter) + Background + custom variable format \n")
+    # Logging with custom field fields
+    logger.info("User logged in", extra={"user_id": "U12345"})
 
+    print("\n", SEPARATOR, "\n")
 
-FORMAT="%(asctime)s [%(levelname)s] %(name)s | user=%(user_id)s | %(message)s"
-logger = setup_logging(show_background=True, format_template=FORMAT, name="TEST [6]")
+    print("Test function (CustomFormatter) + Background + custom variable format \n")
 
-# Logging with custom field fields
-logger.info("User logged in", extra={"user_id": "U12345"})
 
+    FORMAT="%(asctime)s [%(levelname)s] %(name)s | user=%(user_id)s | %(message)s"
+    logger = setup_logging(show_background=True, format_template=FORMAT, name="TEST [6]")
+
+    # Logging with custom field fields
+    logger.info("User logged in", extra={"user_id": "U12345"})
+
+
+if __name__ == "__main__":
+    main()
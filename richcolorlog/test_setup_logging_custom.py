@@ -1,35 +1,33 @@
-import os
-from logger import setup_logging_custom
+import logging
+import shutil
+from logger import setup_logging_custom, _log_each_level, NOTICE_LEVEL, EMERGENCY_LEVEL, ALERT_LEVEL
+
+LEVELS = (
+    ("critical", logging.CRITICAL),
+    ("error", logging.ERROR),
+    ("warning", logging.WARNING),
+    ("notice", NOTICE_LEVEL),
+    ("info", logging.INFO),
+    ("debug", logging.DEBUG),
+    ("emergency", EMERGENCY_LEVEL),
+    ("alert", ALERT_LEVEL),
+    ("fatal", logging.FATAL),
+)
+SEPARATOR = "=" * (shutil.get_terminal_size()[0] - 3)
 
 print("Test function (CustomFormatter), No Background Color.\n")
 
 logger = setup_logging_custom(show_background=False)
 
-logger.critical("This is a critical message")
-logger.error("This is an error message")
-logger.warning("This is a warning message")
-logger.notice("This is a notice message")
-logger.info("This is an info message")
-logger.debug("This is a debug message")
-logger.emergency("This is a emergency message")
-logger.alert("This is a alert message")
-logger.fatal("This is a fatal message")
+_log_each_level(logger, levels=LEVELS)
 
-print("\n", "="*(os.get_terminal_size()[0] - 3), "\n")
+print("\n", SEPARATOR, "\n")
 
 print("Test function (CustomFormatter), Background Color.\n")
 
 logger = setup_logging_custom(show_background=True)
 
-logger.critical("This is a critical message")
-logger.error("This is an error message")
-logger.warning("This is a warning message")
-logger.notice("This is a notice message")
-logger.info("This is an info message")
-logger.debug("This is a debug message")
-logger.emergency("This is a emergency message")
-logger.alert("This is a alert message")
-logger.fatal("This is a fatal message")
+_log_each_level(logger, levels=LEVELS)
 
 # print("Test function (CustomFormatter), LEXER + No Background Color.\n")
 print("Test function (CustomFormatter), LEXER\n")
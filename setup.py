@@ -5,18 +5,22 @@ Setup script for Rich Color Log package.
 
 from setuptools import setup, find_packages
 import os
+import re
 import shutil
-from pathlib import Path
 import traceback
 
 NAME = "richcolorlog"
 this_directory = os.path.abspath(os.path.dirname(__file__))
 
-if (Path(__file__).parent / '__version__.py').is_file():
-    shutil.copy(str((Path(__file__).parent / '__version__.py')), os.path.join(this_directory, NAME, '__version__.py'))
+def copy_if_newer(name):
+    """Copy ``name`` from the project root into the package unless the copy there is current."""
+    src = os.path.join(this_directory, name)
+    dst = os.path.join(this_directory, NAME, name)
+    if os.path.isfile(src) and (not os.path.isfile(dst) or os.path.getmtime(src) > os.path.getmtime(dst)):
+        shutil.copy(src, dst)
 
-if (Path(__file__).parent / 'screenshot.png').is_file():
-    shutil.copy(str((Path(__file__).parent / 'screenshot.png')), os.path.join(this_directory, NAME, 'screenshot.png'))
+copy_if_newer('__version__.py')
+copy_if_newer('screenshot.png')
     
 # Read the contents of README file
 with open(os.path.join(this_directory, 'README.md'), encoding='utf-8') as f:
@@ -31,16 +35,14 @@ def get_version():
     version = "0.33"
     """
     try:
-        version_file = Path(__file__).parent / "__version__.py"
-        if not version_file.is_file():
-            version_file = Path(__file__).parent / NAME / "__version__.py"
-        if version_file.is_file():
+        version_file = os.path.join(this_directory, "__version__.py")
+        if not os.path.isfile(version_file):
+            version_file = os.path.join(this_directory, NAME, "__version__.py")
+        if os.path.isfile(version_file):
             with open(version_file, "r") as f:
-                for line in f:
-                    if line.strip().startswith("version"):
-                        parts = line.split("=")
-                        if len(parts) == 2:
-                            return parts[1].strip().strip('"').strip("'")
+                match = re.search(r'^\s*version\s*=\s*["\']([^"\']+)["\']', f.read(), re.M)
+            if match:
+                return match.group(1)
     except Exception as e:
         if os.getenv('TRACEBACK') and os.getenv('TRACEBACK') in ['1', 'true', 'True']:
             print(traceback.format_exc())
@@ -49,12 +51,14 @@ def get_version():
 
     return "1.0.0"
 
+VERSION = get_version()
+
 print(f"NAME   : {NAME}")
-print(f"VERSION: {get_version()}")
+print(f"VERSION: {VERSION}")
 
 setup(
     name=NAME,
-    version=get_version(),
+    version=VERSION,
     author="Hadi Cahyadi",
     author_email="cumulus13@gmail.com",
     description="A beautiful and feature-rich logging package using Rich library",
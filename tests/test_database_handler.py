@@ -0,0 +1,44 @@
+import logging
+import sqlite3
+
+from richcolorlog.logger import DatabaseHandler
+
+
+def _record(level, msg):
+    return logging.LogRecord("db_test", level, __file__, 1, msg, None, None)
+
+
+def _messages(path):
+    with sqlite3.connect(str(path)) as conn:
+        return [row[0] for row in conn.execute("SELECT message FROM log_syslog ORDER BY id")]
+
+
+def test_writes_synchronously_by_default(tmp_path):
+    path = tmp_path / "logs.db"
+    handler = DatabaseHandler(db_type="sqlite", database=str(path))
+    try:
+        assert handler._worker is None
+        handler.emit(_record(logging.INFO, "stored"))
+        assert _messages(path) == ["stored"]
+    finally:
+        handler.close()
+
+
+def test_async_queue_overflow_keeps_errors(tmp_path):
+    path = tmp_path / "logs.db"
+    handler = DatabaseHandler(db_type="sqlite", database=str(path), use_async=True, queue_size=2)
+    # Stop the writer so the queue fills up.
+    handler._stop.set()
+    handler._wakeup.set()
+    handler._worker.join(5)
+
+    handler.emit(_record(logging.INFO, "info 1"))
+    handler.emit(_record(logging.INFO, "info 2"))
+    handler.emit(_record(logging.INFO, "info 3"))
+    handler.emit(_record(logging.ERROR, "error 1"))
+    handler.emit(_record(logging.ERROR, "error 2"))
+    handler.emit(_record(logging.ERROR, "error 3"))
+
+    assert [row[3] for row in handler._queue] == ["error 1", "error 2"]
+    assert handler.get_stats() == {"queued": 2, "dropped": 4}
+    handler.connection.close()
@@ -0,0 +1,40 @@
+import logging.handlers
+
+from richcolorlog import setup_logging
+
+
+def _file_handlers(logger):
+    return [h for h in logger.handlers if isinstance(h, logging.handlers.MemoryHandler)]
+
+
+def test_buffered_file_keeps_args_as_logged(tmp_path):
+    path = tmp_path / "buffered.log"
+    logger = setup_logging(
+        name="file_buffer_test",
+        log_file=True,
+        log_file_name=str(path),
+        log_file_buffer=16,
+        log_file_flush_interval=0,
+    )
+    state = {"n": 1}
+    logger.info("state %s", state)
+    state["n"] = 999
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.warning("caught", exc_info=True)
+    for handler in _file_handlers(logger):
+        handler.flush()
+
+    content = path.read_text()
+    assert "state {'n': 1}" in content
+    assert "999" not in content
+    assert "ValueError: boom" in content
+
+
+def test_file_is_unbuffered_by_default(tmp_path):
+    path = tmp_path / "plain.log"
+    logger = setup_logging(name="file_default_test", log_file=True, log_file_name=str(path))
+    assert not _file_handlers(logger)
+    logger.info("written now")
+    assert "written now" in path.read_text()
@@ -0,0 +1,29 @@
+import io
+import logging
+
+from richcolorlog import setup_logging, set_disabled
+
+
+def test_show_true_while_disabled_keeps_logging_usable():
+    logger = setup_logging(name="set_disabled_test")
+    stream = io.StringIO()
+    capture = logging.StreamHandler(stream)
+    logger.addHandler(capture)
+    root = logging.getLogger()
+    root_level, root_handlers = root.level, list(root.handlers)
+    try:
+        set_disabled(True)
+        logger.info("hidden")
+        logger.info("forced", show=True)
+        set_disabled(False)
+        logger.info("after")
+    finally:
+        set_disabled(False)
+        logger.removeHandler(capture)
+
+    output = stream.getvalue()
+    assert "hidden" not in output
+    assert "forced" in output
+    assert "after" in output
+    assert root.level == root_level
+    assert root.handlers == root_handlers